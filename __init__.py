@@ -19,14 +19,45 @@ from bpy.props import (
     CollectionProperty,
     BoolProperty,
 )
-import json
-import os
+import math
+import struct
+import time
+from array import array
+
+try:
+    import numpy as np  # bundled with Blender
+except Exception:  # pragma: no cover - optional
+    np = None  # type: ignore
+
+# Optional JIT for the clamp/convert kernel; plain NumPy when numba is not
+# installed (no wheel is bundled for it)
+if np is not None:
+    try:
+        from numba import njit  # type: ignore
+
+        @njit(cache=True, fastmath=True)
+        def _compute_units(z, s, o, lo, hi):
+            return s * np.minimum(np.maximum(z, lo), hi) + o
+    except Exception:  # pragma: no cover - optional
+        def _compute_units(z, s, o, lo, hi):
+            return s * np.clip(z, lo, hi) + o
 
 # Local module providing CAN communication (stubbed if python-can not available)
 from . import robstride_can
 from . import deps
 
 
+def _on_host_id_update(self, context):
+    # Keep the manager's host address in sync at set-time so the frame
+    # handler never has to touch preferences
+    global _last_prefs_snapshot
+    _last_prefs_snapshot = None
+    try:
+        robstride_can.manager._host_addr = int(self.host_id_low) & 0xFF  # type: ignore[attr-defined]
+    except Exception:
+        pass
+
+
 class RobStrideAddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
@@ -53,6 +84,7 @@ class RobStrideAddonPreferences(bpy.types.AddonPreferences):
         default=0xAA,
         min=0,
         max=255,
+        update=_on_host_id_update,
     )
     scan_min_id: IntProperty(
         name="Scan Min ID",
@@ -73,6 +105,13 @@ class RobStrideAddonPreferences(bpy.types.AddonPreferences):
         description="Probe common IDs only (faster). Disable for full range scan.",
         default=True,
     )
+    tick_ms: IntProperty(
+        name="Tick (ms)",
+        description="Minimum interval between sync handler runs; caps CAN traffic while scrubbing the timeline",
+        default=10,
+        min=0,
+        max=1000,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -81,6 +120,7 @@ class RobStrideAddonPreferences(bpy.types.AddonPreferences):
         col.prop(self, "channel")
         col.prop(self, "bitrate")
         col.prop(self, "host_id_low")
+        col.prop(self, "tick_ms")
         # Scan options
         col.prop(self, "scan_quick")
         grid = layout.grid_flow(columns=2, even_columns=True, even_rows=True)
@@ -88,10 +128,238 @@ class RobStrideAddonPreferences(bpy.types.AddonPreferences):
         grid.prop(self, "scan_max_id")
 
 
+# ensure_dependencies can pip-install bundled wheels, which must not run on
+# addon enable (it would block Blender startup); defer it to the first
+# operator that actually needs the bus.
+_deps_checked = False
+
+
+def _ensure_deps_once():
+    global _deps_checked
+    if not _deps_checked:
+        deps.ensure_dependencies()
+        _deps_checked = True
+
+
+_DEG2RAD = math.pi / 180.0
+_TAU = math.tau
+
+# Mode identifiers, hoisted so hot paths compare against module-level
+# constants instead of rebuilding literals/sets per call.
+_MODE_RUN = 'RUN'
+_MODE_LEARN = 'LEARN'
+_VALID_MODES = frozenset((_MODE_RUN, _MODE_LEARN))
+
+
+# Memoized addon entry so operators and the frame handler do not walk the
+# addons dict on every call; cleared in unregister().
+_prefs_entry = None
+
+
+def _get_prefs(context=None):
+    global _prefs_entry
+    if _prefs_entry is None:
+        ctx = context if context is not None else bpy.context
+        _prefs_entry = ctx.preferences.addons[__name__]
+    return _prefs_entry.preferences
+
+
+# Snapshot of the last preference values pushed into the manager; repeat
+# pushes with unchanged prefs collapse into one tuple compare.
+_last_prefs_snapshot = None
+
+
+def _sync_prefs_to_manager(prefs):
+    global _last_prefs_snapshot
+    snap = (
+        prefs.interface,
+        prefs.channel,
+        int(prefs.bitrate),
+        int(prefs.host_id_low),
+        int(prefs.scan_min_id),
+        int(prefs.scan_max_id),
+        bool(prefs.scan_quick),
+    )
+    if snap == _last_prefs_snapshot:
+        return
+    mgr = robstride_can.manager
+    mgr.configure(interface=snap[0], channel=snap[1], bitrate=snap[2])
+    # Force raw protocol to match provided scripts
+    try:
+        mgr.set_prefer_vendor(False)
+    except Exception:
+        pass
+    try:
+        mgr._host_addr = snap[3] & 0xFF  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    try:
+        mgr.set_scan_options(min_id=snap[4], max_id=snap[5], quick=snap[6])
+    except Exception:
+        pass
+    _last_prefs_snapshot = snap
+
+
+# Auto-connections made on behalf of a single operator click linger for a
+# few seconds instead of tearing the bus down immediately, so a sequence of
+# Enable/Send/Disable clicks pays the connect latency once. 0.0 means the
+# connection is user-owned (or closed) and the expiry timer must not touch it.
+_autoconnect_until = 0.0
+_AUTOCONNECT_LINGER_S = 5.0
+
+
+def _autoconnect_expire():
+    global _autoconnect_until
+    if _autoconnect_until == 0.0:
+        return None
+    remaining = _autoconnect_until - time.monotonic()
+    if remaining > 0.0:
+        return remaining
+    _autoconnect_until = 0.0
+    try:
+        robstride_can.manager.disconnect()
+    except Exception:
+        pass
+    _reset_handler_caches()
+    return None
+
+
+def _ensure_connected():
+    # Returns True when the bus is usable. Connections opened here are closed
+    # by the expiry timer once idle; explicit connects are left alone.
+    global _autoconnect_until
+    mgr = robstride_can.manager
+    if mgr.is_connected():
+        if _autoconnect_until:
+            _autoconnect_until = time.monotonic() + _AUTOCONNECT_LINGER_S
+        return True
+    try:
+        if not mgr.connect():
+            return False
+    except Exception:
+        return False
+    _autoconnect_until = time.monotonic() + _AUTOCONNECT_LINGER_S
+    try:
+        if not bpy.app.timers.is_registered(_autoconnect_expire):
+            bpy.app.timers.register(_autoconnect_expire, first_interval=_AUTOCONNECT_LINGER_S)
+    except Exception:
+        pass
+    return True
+
+
+# Plain-Python mirror of the configured nodes (only those with a linked
+# object). RNA property access is comparatively slow, so the frame handler
+# iterates this list and it is rebuilt lazily whenever a node property or the
+# collection changes.
+_node_cache = []
+_active_dirty = True
+
+# Vectorized mirror of RUN-mode entries; only built when enough motors are
+# configured for NumPy to beat the scalar loop.
+_run_vec = None
+_VECTOR_MIN_NODES = 8
+
+
+# node_id -> index into scene.robstride_nodes, kept warm between scans so
+# repeat merges skip the O(N) rebuild; invalidated with the node cache.
+_node_index = {}
+_node_index_valid = False
+
+
+def _get_node_index(nodes):
+    global _node_index_valid
+    if not _node_index_valid:
+        _node_index.clear()
+        for i, n in enumerate(nodes):
+            _node_index[n.node_id] = i
+        _node_index_valid = True
+    return _node_index
+
+
+def _mark_nodes_dirty(self=None, context=None):
+    global _active_dirty, _node_index_valid
+    _active_dirty = True
+    _node_index_valid = False
+    if context is not None:
+        try:
+            _ensure_handler_state(context.scene)
+        except Exception:
+            pass
+
+
+# Node IDs whose gains changed since last sent; written by the kp/ki/kd
+# update callbacks so the handler does no per-frame PID comparison at all.
+_pid_dirty = set()
+
+
+def _mark_pid_dirty(self, context=None):
+    _pid_dirty.add(int(self.node_id))
+    # Gains are mirrored in the node cache as well
+    _mark_nodes_dirty(self, context)
+
+
+def _ensure_handler_state(scene):
+    # Keep the frame handler installed only while at least one node is linked;
+    # an idle session then pays nothing per frame change.
+    handlers = bpy.app.handlers.frame_change_post
+    want = any(n.object_ref for n in scene.robstride_nodes)
+    if want:
+        if robstride_sync_handler not in handlers:
+            handlers.append(robstride_sync_handler)
+    elif robstride_sync_handler in handlers:
+        handlers.remove(robstride_sync_handler)
+
+
+def _rebuild_node_cache(scene):
+    global _run_vec
+    _node_cache.clear()
+    for node in scene.robstride_nodes:
+        if not node.object_ref:
+            continue
+        # Invalid (min >= max) bounds mean "no clamp"; bake that in as
+        # +/-inf so per-frame clamps are branchless min/max calls
+        lo = float(node.min_rot)
+        hi = float(node.max_rot)
+        if lo >= hi:
+            lo, hi = float('-inf'), float('inf')
+        _node_cache.append({
+            'obj': node.object_ref,
+            'id': int(node.node_id),
+            'mode': node.mode,
+            'kp': float(node.kp),
+            'ki': float(node.ki),
+            'kd': float(node.kd),
+            'scale': float(node.scale),
+            'offset': float(node.offset),
+            'lo': lo,
+            'hi': hi,
+        })
+
+    # Re-seed the dirty set so new/reloaded nodes get their gains pushed
+    # once; _send_pid_if_changed still dedupes against what was last sent
+    _pid_dirty.update(e['id'] for e in _node_cache)
+
+    # Contiguous arrays for the RUN-mode math when there are enough motors
+    _run_vec = None
+    if np is not None:
+        run_entries = [e for e in _node_cache if e['mode'] == _MODE_RUN]
+        if len(run_entries) >= _VECTOR_MIN_NODES:
+            _run_vec = {
+                'entries': run_entries,
+                'ids': [e['id'] for e in run_entries],
+                'scales': np.array([e['scale'] for e in run_entries]),
+                'offsets': np.array([e['offset'] for e in run_entries]),
+                'mins': np.array([e['lo'] for e in run_entries]),
+                'maxs': np.array([e['hi'] for e in run_entries]),
+                'z': np.empty(len(run_entries)),
+                'last': np.full(len(run_entries), np.nan),
+            }
+
+
 class RobStridenodeNode(bpy.types.PropertyGroup):
     name: StringProperty(name="Name", default="Node")
-    node_id: IntProperty(name="ID", default=0, min=0)
-    object_ref: PointerProperty(name="Object", type=bpy.types.Object)
+    node_id: IntProperty(name="ID", default=0, min=0, update=_mark_nodes_dirty)
+    object_ref: PointerProperty(name="Object", type=bpy.types.Object, update=_mark_nodes_dirty)
     target_deg: FloatProperty(
         name="Target (deg)",
         description="Target position to send using raw protocol (degrees)",
@@ -104,113 +372,158 @@ class RobStridenodeNode(bpy.types.PropertyGroup):
             ("LEARN", "Learn", "Read encoder and keyframe object Z"),
         ],
         default="RUN",
+        update=_mark_nodes_dirty,
     )
-    kp: FloatProperty(name="Kp", default=1.0)
-    ki: FloatProperty(name="Ki", default=0.0)
-    kd: FloatProperty(name="Kd", default=0.0)
+    kp: FloatProperty(name="Kp", default=1.0, update=_mark_pid_dirty)
+    ki: FloatProperty(name="Ki", default=0.0, update=_mark_pid_dirty)
+    kd: FloatProperty(name="Kd", default=0.0, update=_mark_pid_dirty)
     scale: FloatProperty(
         name="Scale",
         description="Radians in/out (device speaks radians). Keep 1.0 unless you need gearing/scaling.",
         default=1.0,
+        update=_mark_nodes_dirty,
     )
     offset: FloatProperty(
         name="Offset",
         description="Radians offset (additive) if needed. Typically 0.0.",
         default=0.0,
+        update=_mark_nodes_dirty,
     )
     min_rot: FloatProperty(
         name="Min Z (rad)",
         description="Minimum allowed Z rotation (radians)",
-        default=-6.283185307179586,
+        default=-_TAU,
+        update=_mark_nodes_dirty,
     )
     max_rot: FloatProperty(
         name="Max Z (rad)",
         description="Maximum allowed Z rotation (radians)",
-        default=6.283185307179586,
+        default=_TAU,
+        update=_mark_nodes_dirty,
     )
 
 
+def _sync_nodes_from_found(nodes, found, remove_missing=False):
+    # Diff the collection against scan results with one dict build and one
+    # set of IDs instead of repeated per-entry conversions and lookups.
+    # Returns the IDs that were newly added.
+    found_by_id = {int(m.get("id", 0)): m for m in found}
+    index = _get_node_index(nodes)
+    removed = False
+    if remove_missing:
+        remove_indices = [i for m_id, i in index.items() if m_id not in found_by_id]
+        for i in sorted(remove_indices, reverse=True):
+            nodes.remove(i)
+        if remove_indices:
+            # Removal shifts collection indices; rebuild before the add pass
+            removed = True
+            _node_index.clear()
+            for i, n in enumerate(nodes):
+                _node_index[n.node_id] = i
+    new_ids = []
+    for m_id, m in found_by_id.items():
+        if m_id not in index:
+            # Keep user-customized names on existing nodes; only new IDs are added
+            n = nodes.add()
+            n.name = str(m.get("name", f"node {m_id}"))
+            n.node_id = m_id
+            index[m_id] = len(nodes) - 1
+            new_ids.append(m_id)
+    if new_ids or removed:
+        _mark_nodes_dirty()
+        # The merge itself kept the index consistent
+        globals()['_node_index_valid'] = True
+    return new_ids
+
+
 class ROBSTRIDE_OT_scan(bpy.types.Operator):
     bl_idname = "robstride.scan"
     bl_label = "Scan RobStride Nodes"
     bl_description = "Find nodes on the configured CAN bus and populate nodes"
     bl_options = {"REGISTER"}
 
-    def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
+    _timer = None
+    _thread = None
+    _queue = None
 
-        # Initialize CAN manager with preferences
-        deps.ensure_dependencies()
-        robstride_can.manager.configure(
-            interface=prefs.interface,
-            channel=prefs.channel,
-            bitrate=prefs.bitrate,
-        )
-        # Force raw protocol to match provided scripts
-        try:
-            robstride_can.manager.set_prefer_vendor(False)
-        except Exception:
-            pass
-        # Match raw protocol host/master low byte with working scripts (default 0xAA)
-        try:
-            robstride_can.manager._host_addr = int(prefs.host_id_low) & 0xFF  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Scan options for raw protocol
-        try:
-            robstride_can.manager.set_scan_options(
-                min_id=int(prefs.scan_min_id), max_id=int(prefs.scan_max_id), quick=bool(prefs.scan_quick)
-            )
-        except Exception:
-            pass
+    def _prepare(self, context):
+        # Shared setup for both the modal (UI) and synchronous (script) paths
+        _ensure_deps_once()
+        _sync_prefs_to_manager(_get_prefs(context))
         # Respect simulation toggle even when connected (scan will merge sim + real)
         sim_flag = bool(context.scene.robstride_simulate)
         connected = robstride_can.manager.is_connected()
         robstride_can.manager.set_simulate(sim_flag)
-
-        # If not connected and not simulating, attempt a temporary connection for scanning
-        temp_connected = False
         if not (connected or sim_flag):
-            if robstride_can.manager.connect():
-                temp_connected = True
-            else:
+            # Auto-connections linger and are torn down by the expiry timer
+            if not _ensure_connected():
                 self.report({'ERROR'}, "Not connected and failed to connect for scan.")
-                return {'CANCELLED'}
-
-        found = robstride_can.manager.scan()
+                return False
+        return True
 
+    def _apply_found(self, context, found):
         scene = context.scene
-        nodes = scene.robstride_nodes
-
-        # Remove nodes that are no longer present
-        found_ids = {int(m.get("id", 0)) for m in found}
-        remove_indices = [i for i, n in enumerate(nodes) if n.node_id not in found_ids]
-        for i in reversed(remove_indices):
-            nodes.remove(i)
+        # Scan replaces the collection contents: remove stale IDs, add new ones
+        _sync_nodes_from_found(scene.robstride_nodes, found, remove_missing=True)
+        _ensure_handler_state(scene)
+        self.report({'INFO'}, f"Found {len(found)} nodes")
 
-        # Build a map of existing nodes by ID (after removals)
-        existing = {n.node_id: n for n in nodes}
+    def invoke(self, context, event):
+        # Run the bus probing on a worker thread so a full-range scan (up to
+        # 128 sequential round-trips) cannot freeze the UI; results come back
+        # through a queue and the worker never touches bpy.
+        if not self._prepare(context):
+            return {'CANCELLED'}
 
-        # Update or add nodes
-        for m in found:
-            m_id = int(m.get("id", 0))
-            m_name = str(m.get("name", f"node {m_id}"))
-            if m_id in existing:
-                # Keep user-customized name; do not overwrite
-                n = existing[m_id]
-            else:
-                n = nodes.add()
-                n.name = m_name
-                n.node_id = m_id
+        import queue
+        import threading
+        self._queue = queue.Queue()
 
-        # Disconnect if we connected temporarily just for the scan
-        if temp_connected:
+        def _scan_worker(q=self._queue):
             try:
-                robstride_can.manager.disconnect()
-            except Exception:
-                pass
+                q.put(('ok', robstride_can.manager.scan()))
+            except Exception as e:
+                q.put(('err', str(e)))
+
+        self._thread = threading.Thread(target=_scan_worker, daemon=True)
+        self._thread.start()
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
-        self.report({'INFO'}, f"Found {len(found)} nodes")
+    def modal(self, context, event):
+        global _autoconnect_until
+        if event.type == 'ESC':
+            self._remove_timer(context)
+            self.report({'INFO'}, "Scan cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        # Keep any lingering auto-connection alive while the scan runs
+        if _autoconnect_until:
+            _autoconnect_until = time.monotonic() + _AUTOCONNECT_LINGER_S
+        try:
+            kind, payload = self._queue.get_nowait()
+        except Exception:
+            return {'PASS_THROUGH'}
+        self._remove_timer(context)
+        if kind == 'err':
+            self.report({'ERROR'}, f"Scan failed: {payload}")
+            return {'CANCELLED'}
+        self._apply_found(context, payload)
+        return {'FINISHED'}
+
+    def _remove_timer(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+    def execute(self, context):
+        # Synchronous path for scripted calls (bpy.ops without invoke)
+        if not self._prepare(context):
+            return {'CANCELLED'}
+        self._apply_found(context, robstride_can.manager.scan())
         return {'FINISHED'}
 
 
@@ -221,35 +534,20 @@ class ROBSTRIDE_OT_connect_toggle(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _get_prefs(context)
         scene = context.scene
 
-        deps.ensure_dependencies()
-        robstride_can.manager.configure(
-            interface=prefs.interface,
-            channel=prefs.channel,
-            bitrate=prefs.bitrate,
-        )
-        try:
-            robstride_can.manager.set_prefer_vendor(False)
-        except Exception:
-            pass
-        # Ensure raw protocol host/master low byte matches expected (0xAA)
-        try:
-            robstride_can.manager._host_addr = int(prefs.host_id_low) & 0xFF  # type: ignore[attr-defined]
-        except Exception:
-            pass
+        _ensure_deps_once()
+        _sync_prefs_to_manager(prefs)
         robstride_can.manager.set_simulate(bool(scene.robstride_simulate))
-        # Scan options for raw protocol
-        try:
-            robstride_can.manager.set_scan_options(
-                min_id=int(prefs.scan_min_id), max_id=int(prefs.scan_max_id), quick=bool(prefs.scan_quick)
-            )
-        except Exception:
-            pass
+
+        # Explicit connects/disconnects take ownership from the linger timer
+        global _autoconnect_until
+        _autoconnect_until = 0.0
 
         if robstride_can.manager.is_connected():
             robstride_can.manager.disconnect()
+            _reset_handler_caches()
             self.report({'INFO'}, "Disconnected")
             return {'FINISHED'}
 
@@ -258,26 +556,15 @@ class ROBSTRIDE_OT_connect_toggle(bpy.types.Operator):
             self.report({'ERROR'}, "Failed to connect")
             return {'CANCELLED'}
 
-        # After connecting, scan and ensure nodes are added/prepared
+        # After connecting, scan and ensure nodes are added/prepared.
+        # Do not remove on connect; only add new IDs.
         found = robstride_can.manager.scan()
-        nodes = scene.robstride_nodes
-
-        # Do not remove on connect; only add/update
-        existing = {n.node_id: n for n in nodes}
-        for m in found:
-            m_id = int(m.get("id", 0))
-            m_name = str(m.get("name", f"node {m_id}"))
-            if m_id in existing:
-                # Keep user-defined name
-                pass
-            else:
-                n = nodes.add()
-                n.name = m_name
-                n.node_id = m_id
+        new_ids = _sync_nodes_from_found(scene.robstride_nodes, found)
 
-        # Prepare canopen nodes where applicable
-        for n in nodes:
-            robstride_can.manager.prepare_node(n.node_id)
+        # Prepare canopen nodes where applicable; existing IDs are prepared
+        # lazily on first use, so only the new ones need it here
+        robstride_can.manager.prepare_nodes_batch(new_ids)
+        _ensure_handler_state(scene)
 
         self.report({'INFO'}, "Connected and prepared nodes")
         return {'FINISHED'}
@@ -292,16 +579,8 @@ class ROBSTRIDE_OT_node_enable(bpy.types.Operator):
     node_id: IntProperty()
 
     def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
-        # Ensure host low byte matches scripts and connect if needed
-        try:
-            robstride_can.manager._host_addr = int(prefs.host_id_low) & 0xFF  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        temp = False
-        if not robstride_can.manager.is_connected():
-            if robstride_can.manager.connect():
-                temp = True
+        _sync_prefs_to_manager(_get_prefs(context))
+        _ensure_connected()
         try:
             robstride_can.manager.enable_node(int(self.node_id), True)
             self.report({'INFO'}, f"Enabled node {int(self.node_id)}")
@@ -309,12 +588,6 @@ class ROBSTRIDE_OT_node_enable(bpy.types.Operator):
         except Exception as e:
             self.report({'ERROR'}, f"Enable failed: {e}")
             return {'CANCELLED'}
-        finally:
-            if temp:
-                try:
-                    robstride_can.manager.disconnect()
-                except Exception:
-                    pass
 
 
 class ROBSTRIDE_OT_node_disable(bpy.types.Operator):
@@ -326,15 +599,8 @@ class ROBSTRIDE_OT_node_disable(bpy.types.Operator):
     node_id: IntProperty()
 
     def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
-        try:
-            robstride_can.manager._host_addr = int(prefs.host_id_low) & 0xFF  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        temp = False
-        if not robstride_can.manager.is_connected():
-            if robstride_can.manager.connect():
-                temp = True
+        _sync_prefs_to_manager(_get_prefs(context))
+        _ensure_connected()
         try:
             robstride_can.manager.enable_node(int(self.node_id), False)
             self.report({'INFO'}, f"Disabled node {int(self.node_id)}")
@@ -342,12 +608,6 @@ class ROBSTRIDE_OT_node_disable(bpy.types.Operator):
         except Exception as e:
             self.report({'ERROR'}, f"Disable failed: {e}")
             return {'CANCELLED'}
-        finally:
-            if temp:
-                try:
-                    robstride_can.manager.disconnect()
-                except Exception:
-                    pass
 
 
 class ROBSTRIDE_OT_node_move(bpy.types.Operator):
@@ -360,31 +620,17 @@ class ROBSTRIDE_OT_node_move(bpy.types.Operator):
     degrees: FloatProperty(name="Degrees", default=0.0)
 
     def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
-        # Convert degrees to radians as used by move.py
-        import math
+        _sync_prefs_to_manager(_get_prefs(context))
         try:
-            try:
-                robstride_can.manager._host_addr = int(prefs.host_id_low) & 0xFF  # type: ignore[attr-defined]
-            except Exception:
-                pass
-            temp = False
-            if not robstride_can.manager.is_connected():
-                if robstride_can.manager.connect():
-                    temp = True
-            radians = float(self.degrees) * math.pi / 180.0
+            _ensure_connected()
+            # Convert degrees to radians as used by move.py
+            radians = float(self.degrees) * _DEG2RAD
             robstride_can.manager.send_position(int(self.node_id), radians)
             self.report({'INFO'}, f"Node {int(self.node_id)} -> {float(self.degrees):.2f}°")
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f"Send failed: {e}")
             return {'CANCELLED'}
-        finally:
-            if 'temp' in locals() and temp:
-                try:
-                    robstride_can.manager.disconnect()
-                except Exception:
-                    pass
 
 
 class ROBSTRIDE_OT_save_config(bpy.types.Operator):
@@ -397,6 +643,7 @@ class ROBSTRIDE_OT_save_config(bpy.types.Operator):
 
     def invoke(self, context, event):
         if not self.filepath:
+            import os
             self.filepath = os.path.join(
                 os.path.expanduser("~"),
                 "robstride_config.json",
@@ -406,7 +653,7 @@ class ROBSTRIDE_OT_save_config(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _get_prefs(context)
 
         data = {
             "can": {
@@ -414,14 +661,12 @@ class ROBSTRIDE_OT_save_config(bpy.types.Operator):
                 "channel": prefs.channel,
                 "bitrate": int(prefs.bitrate),
             },
-            "nodes": [],
-        }
-
-        for node in scene.robstride_nodes:
-            data["nodes"].append({
+            # Single comprehension so the list is built at its final size;
+            # the walrus keeps object_ref to one RNA resolution per node
+            "nodes": [{
                 "id": int(node.node_id),
                 "name": node.name,
-                "object": node.object_ref.name if node.object_ref else "",
+                "object": obj.name if (obj := node.object_ref) else "",
                 "mode": node.mode,
                 "kp": float(node.kp),
                 "ki": float(node.ki),
@@ -430,11 +675,25 @@ class ROBSTRIDE_OT_save_config(bpy.types.Operator):
                 "offset": float(node.offset),
                 "min": float(node.min_rot),
                 "max": float(node.max_rot),
-            })
+            } for node in scene.robstride_nodes],
+        }
+
+        import json
 
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Prefer orjson (C serializer, single bytes write) when available
+            try:
+                import orjson  # type: ignore
+            except Exception:
+                orjson = None
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                # Compact separators keep the stdlib encoder on its C fast
+                # path (indent forces the pure-Python one) and shrink the file
+                payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+            with open(self.filepath, 'wb') as f:
+                f.write(payload)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to save: {e}")
             return {'CANCELLED'}
@@ -457,17 +716,28 @@ class ROBSTRIDE_OT_load_config(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _get_prefs(context)
 
+        import json
+
+        # One parse into plain dicts: the foreach_set batching below needs
+        # every node materialized anyway, so streaming would only mean
+        # parsing the file twice for the same peak memory
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.filepath, 'rb') as f:
+                raw = f.read()
+            try:
+                import orjson  # type: ignore
+                data = orjson.loads(raw)
+            except Exception:
+                data = json.loads(raw)
+            can_data = data.get("can", {})
+            node_items = data.get("nodes", [])
         except Exception as e:
             self.report({'ERROR'}, f"Failed to load: {e}")
             return {'CANCELLED'}
 
         # Apply CAN settings
-        can_data = data.get("can", {})
         prefs.interface = str(can_data.get("interface", prefs.interface))
         prefs.channel = str(can_data.get("channel", prefs.channel))
         prefs.bitrate = int(can_data.get("bitrate", prefs.bitrate))
@@ -476,21 +746,44 @@ class ROBSTRIDE_OT_load_config(bpy.types.Operator):
         nodes = scene.robstride_nodes
         nodes.clear()
 
-        for m in data.get("nodes", []):
-            n = nodes.add()
-            n.node_id = int(m.get("id", 0))
-            n.name = str(m.get("name", f"node {n.node_id}"))
+        # Snapshot object names once instead of one RNA lookup per node
+        objs = {o.name: o for o in bpy.data.objects}
+
+        # Strings and pointers need per-node assignment, but the numeric
+        # fields are collected into flat lists and written with one
+        # foreach_set (C-level copy) per field. The skipped update callbacks
+        # do not matter: _mark_nodes_dirty below rebuilds every cache.
+        for _ in node_items:
+            nodes.add()
+
+        ids = []
+        kps, kis, kds = [], [], []
+        scales, offsets, mins, maxs = [], [], [], []
+        for n, m in zip(nodes, node_items):
+            m_id = int(m.get("id", 0))
+            ids.append(m_id)
+            n.name = str(m.get("name", f"node {m_id}"))
             obj_name = str(m.get("object", ""))
-            n.object_ref = bpy.data.objects.get(obj_name) if obj_name else None
-            mode = str(m.get("mode", "RUN"))
-            n.mode = mode if mode in {"RUN", "LEARN"} else "RUN"
-            n.kp = float(m.get("kp", 0.0))
-            n.ki = float(m.get("ki", 0.0))
-            n.kd = float(m.get("kd", 0.0))
-            n.scale = float(m.get("scale", 1.0))
-            n.offset = float(m.get("offset", 0.0))
-            n.min_rot = float(m.get("min", -6.283185307179586))
-            n.max_rot = float(m.get("max", 6.283185307179586))
+            n.object_ref = objs.get(obj_name) if obj_name else None
+            mode = str(m.get("mode", _MODE_RUN))
+            n.mode = mode if mode in _VALID_MODES else _MODE_RUN
+            kps.append(float(m.get("kp", 0.0)))
+            kis.append(float(m.get("ki", 0.0)))
+            kds.append(float(m.get("kd", 0.0)))
+            scales.append(float(m.get("scale", 1.0)))
+            offsets.append(float(m.get("offset", 0.0)))
+            mins.append(float(m.get("min", -_TAU)))
+            maxs.append(float(m.get("max", _TAU)))
+        nodes.foreach_set('node_id', ids)
+        nodes.foreach_set('kp', kps)
+        nodes.foreach_set('ki', kis)
+        nodes.foreach_set('kd', kds)
+        nodes.foreach_set('scale', scales)
+        nodes.foreach_set('offset', offsets)
+        nodes.foreach_set('min_rot', mins)
+        nodes.foreach_set('max_rot', maxs)
+        _mark_nodes_dirty()
+        _ensure_handler_state(scene)
 
         self.report({'INFO'}, f"Loaded config: {self.filepath}")
         return {'FINISHED'}
@@ -503,7 +796,12 @@ class ROBSTRIDE_OT_install_deps(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
+        global _deps_checked
         ok, msg = deps.ensure_dependencies()
+        _deps_checked = True
+        # Force the panel to re-probe dependency state on the next redraw
+        _panel_cache["deps_ready"] = False
+        _panel_cache["ts"] = 0.0
         if ok:
             self.report({'INFO'}, f"Dependencies ready ({msg})")
             return {'FINISHED'}
@@ -511,6 +809,26 @@ class ROBSTRIDE_OT_install_deps(bpy.types.Operator):
         return {'CANCELLED'}
 
 
+# Short-TTL cache for panel draw state; the sidebar redraws constantly and
+# re-probing connection state / installed modules each repaint is wasted work.
+_panel_cache = {"ts": 0.0, "connected": False, "deps_ready": False}
+_PANEL_TTL = 0.25
+
+# Per-node online state shares the same TTL; hover redraw storms would
+# otherwise hit the manager lock once per node per repaint
+_status_cache = {}
+
+
+def _cached_status(node_id):
+    now = time.monotonic()
+    ts, val = _status_cache.get(node_id, (0.0, False))
+    if now - ts < _PANEL_TTL:
+        return val
+    val = robstride_can.manager.node_status(node_id)
+    _status_cache[node_id] = (now, val)
+    return val
+
+
 class ROBSTRIDE_PT_panel(bpy.types.Panel):
     bl_label = "RobStride"
     bl_idname = "ROBSTRIDE_PT_panel"
@@ -522,8 +840,24 @@ class ROBSTRIDE_PT_panel(bpy.types.Panel):
         layout = self.layout
         scene = context.scene
 
+        # Refresh cached state at most every _PANEL_TTL seconds
+        now = time.monotonic()
+        if now - _panel_cache["ts"] > _PANEL_TTL:
+            _panel_cache["ts"] = now
+            _panel_cache["connected"] = robstride_can.manager.is_connected()
+            # Dependencies cannot uninstall at runtime: once ready, stay ready
+            # without re-walking sys.modules on every redraw.
+            if not _panel_cache["deps_ready"]:
+                try:
+                    has_can, has_canopen, _has_rs = deps.have_modules()
+                    _panel_cache["deps_ready"] = bool(has_can and has_canopen)
+                except Exception:
+                    _panel_cache["deps_ready"] = False
+        connected = _panel_cache["connected"]
+        deps_ready = _panel_cache["deps_ready"]
+
         # CAN settings box
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _get_prefs(context)
         can_box = layout.box()
         can_box.label(text="CAN Settings", icon='MOD_SIMPLIFY')
         col = can_box.column(align=True)
@@ -534,22 +868,16 @@ class ROBSTRIDE_PT_panel(bpy.types.Panel):
         col.prop(scene, "robstride_simulate", text="Show Simulated Nodes")
         # Connection status only
         net_row = can_box.row(align=True)
-        connected = robstride_can.manager.is_connected()
         net_icon = 'LINKED' if connected else 'UNLINKED'
         net_row.label(text=f"Network: {'Connected' if connected else 'Disconnected'}", icon=net_icon)
 
         row = can_box.row(align=True)
         row.operator(ROBSTRIDE_OT_scan.bl_idname, icon='VIEWZOOM', text="Scan")
-        conn_icon = 'UNLINKED' if robstride_can.manager.is_connected() else 'LINKED'
-        row.operator("robstride.connect_toggle", icon=conn_icon, text=("Disconnect" if robstride_can.manager.is_connected() else "Connect"))
+        conn_icon = 'UNLINKED' if connected else 'LINKED'
+        row.operator("robstride.connect_toggle", icon=conn_icon, text=("Disconnect" if connected else "Connect"))
         row.operator("robstride.save_config", icon='FILE_TICK', text="Save")
         row.operator("robstride.load_config", icon='FILE_FOLDER', text="Load")
         # Only show Install Deps if not installed yet (check without side-effects)
-        try:
-            has_can, has_canopen, _has_rs = deps.have_modules()
-            deps_ready = bool(has_can and has_canopen)
-        except Exception:
-            deps_ready = False
         if not deps_ready:
             row.operator("robstride.install_deps", icon='IMPORT', text="Install Deps")
 
@@ -561,7 +889,7 @@ class ROBSTRIDE_PT_panel(bpy.types.Panel):
             box = layout.box()
             header = box.row(align=True)
             header.prop(node, "name", text="Name")
-            online = robstride_can.manager.node_status(node.node_id)
+            online = _cached_status(node.node_id)
             online_icon = 'CHECKMARK' if online else 'ERROR'
             header.label(text=f"ID {node.node_id}", icon='DRIVER')
             header.label(text=("Online" if online else "Offline"), icon=online_icon)
@@ -598,46 +926,158 @@ _last_pid = {}
 _last_out = {}
 _last_mode = {}
 
+# Packed representation of (kp, ki, kd); comparing bytes is one memcmp
+# instead of three float compares plus a tuple allocation per frame.
+_PID_STRUCT = struct.Struct('<fff')
+
+# Last time the sync handler actually ran; scrubbing fires frame_change_post
+# far faster than the bus can keep up, so runs are debounced to tick_ms.
+_last_tick = 0.0
+
+# Scene whose frame change fell inside the debounce window; a one-shot timer
+# flushes it when the window expires so the final change of a scrub or
+# playback stop is never dropped.
+_pending_sync_scene = None
 
-def _send_pid_if_changed(node):
-    key = node.node_id
-    last = _last_pid.get(key)
-    current = (node.kp, node.ki, node.kd)
-    if last != current:
+
+def _debounced_sync_flush():
+    # One-shot bpy.app.timers callback (trailing edge of the debounce)
+    global _pending_sync_scene, _last_tick
+    scene = _pending_sync_scene
+    _pending_sync_scene = None
+    if scene is not None:
         try:
-            robstride_can.manager.set_pid(key, *current)
-            _last_pid[key] = current
+            _last_tick = 0.0
+            robstride_sync_handler(scene)
         except Exception:
             pass
+    return None
 
 
-def _replace_z_keyframe(obj, frame):
-    ad = getattr(obj, 'animation_data', None)
-    if ad and ad.action:
-        fcurves = ad.action.fcurves
-        for fc in fcurves:
-            if fc.data_path == 'rotation_euler' and fc.array_index == 2:
-                # Remove any keyframe at the current frame so the new one takes priority
-                remove = [kp for kp in fc.keyframe_points if abs(kp.co.x - frame) < 1e-5]
-                for kp in remove:
-                    fc.keyframe_points.remove(kp)
-                fc.update()
-                break
-    # Insert the new keyframe for Z rotation at this frame
-    obj.keyframe_insert(data_path="rotation_euler", index=2)
+def _reset_handler_caches():
+    # Forget last-sent state so a reconnect re-sends PID/enable/position once
+    _last_pid.clear()
+    _last_out.clear()
+    _last_mode.clear()
+    _status_cache.clear()
+    # PID pushes are gated on _pid_dirty, not on _last_pid alone; re-seed it
+    # or an unchanged node collection would never re-send gains to motors
+    # that may have been power-cycled while disconnected
+    _pid_dirty.update(e['id'] for e in _node_cache)
+    # The vectorized RUN path diffs against its own baseline, which would
+    # otherwise survive the disconnect and suppress the re-send
+    if _run_vec is not None:
+        _run_vec['last'].fill(np.nan)
+
+
+def _send_pid_if_changed(node_id, kp, ki, kd):
+    current = _PID_STRUCT.pack(kp, ki, kd)
+    if _last_pid.get(node_id) != current:
+        try:
+            # Enqueue only; the worker thread performs the actual writes
+            robstride_can.manager.post_pid(node_id, kp, ki, kd)
+            _last_pid[node_id] = current
+        except Exception:
+            pass
 
 
-def _get_anim_z_value(obj, frame):
+# Resolved Z-rotation fcurve per object, keyed by object pointer and
+# invalidated when the owning action changes. Avoids walking action.fcurves
+# on every frame for every node.
+_fcurve_cache = {}
+
+
+def _get_z_fcurve(obj):
     ad = getattr(obj, 'animation_data', None)
     if not (ad and ad.action):
         return None
-    for fc in ad.action.fcurves:
-        if fc.data_path == 'rotation_euler' and fc.array_index == 2:
+    action_ptr = ad.action.as_pointer()
+    cached = _fcurve_cache.get(obj.as_pointer())
+    if cached is not None and cached[0] == action_ptr:
+        return cached[1]
+    # fcurves.find runs the scan in C rather than per-fcurve RNA access.
+    # Only hits are cached: a Z curve keyframed later into the same action
+    # must be picked up on the next frame, not shadowed by a stale miss.
+    fc_found = ad.action.fcurves.find('rotation_euler', index=2)
+    if fc_found is not None:
+        _fcurve_cache[obj.as_pointer()] = (action_ptr, fc_found)
+    else:
+        _fcurve_cache.pop(obj.as_pointer(), None)
+    return fc_found
+
+
+# LEARN samples ring-buffered per node in typed arrays and flushed to
+# keyframes in bulk when playback stops or the buffers fill, instead of one
+# F-curve mutation per frame per motor.
+_LEARN_FLUSH_COUNT = 256
+_learn_frames = {}
+_learn_values = {}
+_learn_objs = {}
+
+
+def _playback_active():
+    try:
+        screen = bpy.context.screen
+        return bool(screen and screen.is_animation_playing)
+    except Exception:
+        return False
+
+
+def _flush_learn_buffers():
+    for node_id, frames in _learn_frames.items():
+        if len(frames) == 0:
+            continue
+        values = _learn_values[node_id]
+        obj = _learn_objs.get(node_id)
+        if obj is None:
+            del frames[:]
+            del values[:]
+            continue
+        fc = _get_z_fcurve(obj)
+        if fc is None:
+            # Create the action/fcurve once, then take the direct path
             try:
-                return float(fc.evaluate(frame))
+                obj.keyframe_insert(data_path="rotation_euler", index=2)
             except Exception:
-                return None
-    return None
+                pass
+            _fcurve_cache.pop(obj.as_pointer(), None)
+            fc = _get_z_fcurve(obj)
+        if fc is not None:
+            # Newest sample wins when the same frame was visited twice
+            samples = dict(zip(frames, values))
+            if len(fc.keyframe_points) == 0 and np is not None:
+                # Fresh curve: one bulk add + foreach_set memcpy instead of
+                # per-point inserts
+                ordered = sorted(samples.items())
+                k = len(ordered)
+                fc.keyframe_points.add(k)
+                flat = np.empty(2 * k)
+                flat[0::2] = [f for f, _ in ordered]
+                flat[1::2] = [v for _, v in ordered]
+                fc.keyframe_points.foreach_set('co', flat)
+            else:
+                insert = fc.keyframe_points.insert
+                for f, v in samples.items():
+                    insert(f, v, options={'FAST', 'REPLACE'})
+            fc.update()
+        del frames[:]
+        del values[:]
+
+
+def _get_anim_z_value(obj, frame):
+    fc = _get_z_fcurve(obj)
+    if fc is None:
+        return None
+    try:
+        return float(fc.evaluate(frame))
+    except Exception:
+        # Dead handle (the fcurve was deleted from a live action): drop the
+        # cache entry so the next frame re-resolves instead of failing forever
+        _fcurve_cache.pop(obj.as_pointer(), None)
+        return None
+
+
+_SIM_DEFS = ((1, "Sim node 1"), (2, "Sim node 2"))
 
 
 def _on_simulate_update(self, context):
@@ -646,114 +1086,190 @@ def _on_simulate_update(self, context):
         robstride_can.manager.set_simulate(bool(self.robstride_simulate))
     except Exception:
         pass
-    if getattr(self, 'robstride_simulate', False):
-        try:
-            nodes = self.robstride_nodes
-            existing = {n.node_id for n in nodes}
-            sim_defs = [(1, "Sim node 1"), (2, "Sim node 2")]
-            for nid, name in sim_defs:
-                if nid not in existing:
-                    n = nodes.add()
-                    n.node_id = nid
-                    n.name = name
-        except Exception:
-            pass
+    if not getattr(self, 'robstride_simulate', False):
+        # Toggling off only needs the manager flag; no node scan required.
+        return
+    try:
+        nodes = self.robstride_nodes
+        existing = {n.node_id for n in nodes}
+        for nid, name in _SIM_DEFS:
+            if nid not in existing:
+                n = nodes.add()
+                n.node_id = nid
+                n.name = name
+        _mark_nodes_dirty()
+    except Exception:
+        pass
+
+
+@persistent
+def _robstride_invalidate_caches(*_args):
+    # File loads and undo/redo can invalidate every cached Object/fcurve
+    # pointer; force both caches to rebuild lazily from the RNA data.
+    global _pending_sync_scene
+    _mark_nodes_dirty()
+    _fcurve_cache.clear()
+    _learn_objs.clear()
+    # The stashed scene pointer may be dangling after a load/undo
+    _pending_sync_scene = None
 
 
 @persistent
 def robstride_sync_handler(scene):
     # Run on every frame change; avoids relying on context.screen in handlers
+    global _active_dirty, _last_tick, _pending_sync_scene
 
-    # Keep host ID (low byte) synced from preferences so raw frames match scripts
+    # Debounce: scrubbing can fire this handler hundreds of times per second
+    now = time.monotonic()
     try:
-        prefs = bpy.context.preferences.addons[__name__].preferences
+        tick_s = max(0, int(_get_prefs().tick_ms)) / 1000.0
+    except Exception:
+        tick_s = 0.010
+    if now - _last_tick < tick_s:
+        # Trailing edge: stash the scene and run once when the window
+        # expires, instead of dropping what may be the last change
+        _pending_sync_scene = scene
         try:
-            robstride_can.manager.set_prefer_vendor(False)
+            if not bpy.app.timers.is_registered(_debounced_sync_flush):
+                bpy.app.timers.register(
+                    _debounced_sync_flush,
+                    first_interval=max(tick_s - (now - _last_tick), 0.001))
         except Exception:
             pass
-        robstride_can.manager._host_addr = int(getattr(prefs, 'host_id_low', 0xAA)) & 0xFF  # type: ignore[attr-defined]
-    except Exception:
-        pass
-
-    # If not connected and not simulating, try to connect so RUN mode can drive motors
-    try:
-        if not robstride_can.manager.is_connected() and not bool(scene.robstride_simulate):
-            robstride_can.manager.connect()
-    except Exception:
-        pass
-
-    for node in scene.robstride_nodes:
-        if not node.object_ref:
-            continue
-
-        obj = node.object_ref
-        node_id = node.node_id
-
-        # Skip if not connected and not simulating
-        if not (robstride_can.manager.is_connected() or scene.robstride_simulate):
-            continue
+        return
+    _last_tick = now
+    _pending_sync_scene = None
+
+    # Fast path: nothing to do until at least one node is linked to an object.
+    # The cache mirrors node properties as plain Python values so the per-frame
+    # loop avoids RNA attribute access.
+    if _active_dirty:
+        _rebuild_node_cache(scene)
+        _active_dirty = False
+    if not _node_cache:
+        return
+
+    # Resolve connection/simulation state once; when neither is available
+    # nothing below can do any work, so bail before touching preferences
+    mgr = robstride_can.manager
+    sim = bool(scene.robstride_simulate)
+    connected = mgr.is_connected()
+    if not connected and not sim:
+        # Try to connect so RUN mode can drive motors
+        try:
+            connected = mgr.connect()
+        except Exception:
+            connected = False
+        if not connected:
+            return
 
-        # Update PID if needed
-        _send_pid_if_changed(node)
+    # Collect outgoing work and flush once after the loop so the manager
+    # takes its queue lock once per frame instead of once per node.
+    out_positions = []
+    read_ids = []
+    frame = scene.frame_current
+    # Rate limiting lives in the worker's per-node token bucket, which
+    # defers and re-sends instead of dropping; just keep its floor synced
+    # to the scene setting
+    mgr.set_min_send_interval(float(getattr(scene, 'robstride_min_send_ms', 2.0)))
+
+    for entry in _node_cache:
+        obj = entry['obj']
+        node_id = entry['id']
+        mode = entry['mode']
+
+        # Push gains only when their update callbacks flagged a change
+        if _pid_dirty and node_id in _pid_dirty:
+            _send_pid_if_changed(node_id, entry['kp'], entry['ki'], entry['kd'])
+            _pid_dirty.discard(node_id)
+
+        if _last_mode.get(node_id) != mode:
+            # post_enable only enqueues under the manager lock and never
+            # raises; the worker thread performs the actual bus I/O
+            mgr.post_enable(node_id, mode == _MODE_RUN)
+            if mode == _MODE_LEARN:
+                # Ensure object uses Euler so Z rotation is keyframable and visible
+                try:
+                    obj.rotation_mode = 'XYZ'
+                except Exception:
+                    pass
+            _last_mode[node_id] = mode
 
-        # Handle mode transitions for safe enable/disable
-        prev_mode = _last_mode.get(node_id)
-        if prev_mode != node.mode:
-            try:
-                if node.mode == 'LEARN':
-                    robstride_can.manager.enable_node(node_id, False)
-                    # Ensure object uses Euler so Z rotation is keyframable and visible
-                    try:
-                        obj.rotation_mode = 'XYZ'
-                    except Exception:
-                        pass
-                elif node.mode == 'RUN':
-                    robstride_can.manager.enable_node(node_id, True)
-            except Exception:
-                pass
-            _last_mode[node_id] = node.mode
+        lo = entry['lo']
+        hi = entry['hi']
+        scale = entry['scale']
+        offset = entry['offset']
 
-        if node.mode == 'RUN':
+        if mode == _MODE_RUN:
+            if _run_vec is not None:
+                # Handled below in one vectorized pass over all RUN entries
+                continue
             # Use recorded animation (keyframes) if present, else current property
-            z_from_anim = _get_anim_z_value(obj, scene.frame_current)
+            z_from_anim = _get_anim_z_value(obj, frame)
             z_rad = z_from_anim if z_from_anim is not None else float(obj.rotation_euler[2])
-            # Clamp to configured bounds if valid
-            try:
-                if node.min_rot < node.max_rot:
-                    if z_rad < node.min_rot:
-                        z_rad = node.min_rot
-                    elif z_rad > node.max_rot:
-                        z_rad = node.max_rot
-            except Exception:
-                pass
-            node_units = node.scale * z_rad + node.offset
+            node_units = scale * min(max(z_rad, lo), hi) + offset
 
-            # Non-blocking: enqueue position for background worker
-            robstride_can.manager.post_position(node_id, node_units)
+            # Non-blocking: enqueue position for background worker, which
+            # owns rate limiting; only values identical to the last frame
+            # are skipped here.
+            if _last_out.get(node_id) != node_units:
+                _last_out[node_id] = node_units
+                out_positions.append((node_id, node_units))
 
-        elif node.mode == 'LEARN':
+        elif mode == _MODE_LEARN:
             # Non-blocking: request a read and use last cached value if available
-            robstride_can.manager.request_read(node_id)
-            pos = robstride_can.manager.get_cached_position(node_id)
+            read_ids.append(node_id)
+            pos = mgr.get_cached_position(node_id)
             if pos is None:
                 # Skip this frame if not ready to avoid blocking and FPS drops
                 continue
 
             # node units -> radians
-            z_rad = (pos - node.offset) / node.scale if node.scale != 0.0 else 0.0
-            # Clamp to configured bounds if valid
-            try:
-                if node.min_rot < node.max_rot:
-                    if z_rad < node.min_rot:
-                        z_rad = node.min_rot
-                    elif z_rad > node.max_rot:
-                        z_rad = node.max_rot
-            except Exception:
-                pass
+            z_rad = (pos - offset) / scale if scale != 0.0 else 0.0
+            z_rad = min(max(z_rad, lo), hi)
             obj.rotation_euler[2] = z_rad
 
-            # Ensure incoming encoder value overrides any existing key at this frame
-            _replace_z_keyframe(obj, scene.frame_current)
+            # Buffer the sample; keyframes are written in bulk on flush so the
+            # incoming encoder value still overrides any key at this frame
+            fbuf = _learn_frames.get(node_id)
+            if fbuf is None:
+                fbuf = _learn_frames[node_id] = array('i')
+                _learn_values[node_id] = array('d')
+            fbuf.append(frame)
+            _learn_values[node_id].append(z_rad)
+            _learn_objs[node_id] = obj
+
+    # Vectorized RUN path: gather z-values (RNA access stays a Python loop),
+    # then clamp/scale/diff all motors in NumPy at once.
+    if _run_vec is not None:
+        z = _run_vec['z']
+        for i, entry in enumerate(_run_vec['entries']):
+            obj = entry['obj']
+            z_anim = _get_anim_z_value(obj, frame)
+            z[i] = z_anim if z_anim is not None else obj.rotation_euler[2]
+        out = _compute_units(z, _run_vec['scales'], _run_vec['offsets'], _run_vec['mins'], _run_vec['maxs'])
+        last = _run_vec['last']
+        ids = _run_vec['ids']
+        for i in np.nonzero(out != last)[0]:
+            node_id = ids[i]
+            value = float(out[i])
+            last[i] = value
+            _last_out[node_id] = value
+            out_positions.append((node_id, value))
+
+    # Flush buffered LEARN samples once playback stops, or early when a
+    # buffer fills during very long recordings
+    if _learn_frames and (
+        not _playback_active()
+        or max(len(b) for b in _learn_frames.values()) >= _LEARN_FLUSH_COUNT
+    ):
+        _flush_learn_buffers()
+
+    # Single batched hand-off to the manager per frame
+    if out_positions:
+        mgr.post_positions_batch(out_positions)
+    if read_ids:
+        mgr.request_reads_batch(read_ids)
 
 
 classes = (
@@ -782,22 +1298,60 @@ def register():
         default=False,
         update=_on_simulate_update,
     )
+    bpy.types.Scene.robstride_min_send_ms = FloatProperty(
+        name="Min Send Period (ms)",
+        description="Minimum time between position sends per motor; raise if the CAN bus drops frames",
+        default=2.0,
+        min=0.0,
+        soft_max=100.0,
+    )
 
-    # Install handler
+    # Install handler; once an operator runs, _ensure_handler_state keeps it
+    # registered only while nodes are actually configured
     if robstride_sync_handler not in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.append(robstride_sync_handler)
 
-    # Try to ready dependencies up-front
-    deps.ensure_dependencies()
+    # Seed the manager from saved preferences once; the host_id_low update
+    # callback keeps it current afterwards
+    try:
+        _sync_prefs_to_manager(_get_prefs())
+    except Exception:
+        pass
+
+    # Drop cached pointers whenever the underlying IDs may have been replaced
+    for hook in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _robstride_invalidate_caches not in hook:
+            hook.append(_robstride_invalidate_caches)
+
 
 
 def unregister():
-    # Remove handler
+    global _prefs_entry
+    _prefs_entry = None
+
+    # Do not lose samples recorded since the last flush
+    try:
+        _flush_learn_buffers()
+    except Exception:
+        pass
+
+    # Remove handlers
     if robstride_sync_handler in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.remove(robstride_sync_handler)
+    global _pending_sync_scene
+    _pending_sync_scene = None
+    try:
+        if bpy.app.timers.is_registered(_debounced_sync_flush):
+            bpy.app.timers.unregister(_debounced_sync_flush)
+    except Exception:
+        pass
+    for hook in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _robstride_invalidate_caches in hook:
+            hook.remove(_robstride_invalidate_caches)
 
     del bpy.types.Scene.robstride_nodes
     del bpy.types.Scene.robstride_simulate
+    del bpy.types.Scene.robstride_min_send_ms
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
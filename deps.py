@@ -1,3 +1,6 @@
+import hashlib
+import importlib.util
+import json
 import os
 import sys
 import subprocess
@@ -23,42 +26,79 @@ def add_vendor_to_path() -> None:
 
 
 def have_modules() -> Tuple[bool, bool, bool]:
+    # find_spec only walks the path finders; nothing is imported or executed,
+    # which keeps this probe cheap enough for UI code
+    def _found(name: str) -> bool:
+        try:
+            return importlib.util.find_spec(name) is not None
+        except Exception:
+            return False
+
+    return _found("can"), _found("canopen"), _found("robstride")
+
+
+def _manifest_path() -> str:
+    return os.path.join(_vendor_dir(), ".installed.json")
+
+
+def _wheels_fingerprint() -> str:
+    # Name+size listing is enough to notice added/replaced wheels without
+    # hashing their contents
+    wheels = _wheels_dir()
     try:
-        import can  # noqa: F401
-        has_can = True
+        entries = sorted(
+            f"{name}:{os.path.getsize(os.path.join(wheels, name))}"
+            for name in os.listdir(wheels)
+        )
     except Exception:
-        has_can = False
+        return ""
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def _install_is_cached() -> bool:
     try:
-        import canopen  # noqa: F401
-        has_canopen = True
+        with open(_manifest_path(), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest.get("wheels") == _wheels_fingerprint()
     except Exception:
-        has_canopen = False
+        return False
+
+
+def _record_install() -> None:
     try:
-        import robstride  # type: ignore  # noqa: F401
-        has_robstride = True
+        with open(_manifest_path(), "w", encoding="utf-8") as f:
+            json.dump({"wheels": _wheels_fingerprint()}, f)
     except Exception:
-        has_robstride = False
-    return has_can, has_canopen, has_robstride
+        pass
 
 
 def install_from_wheels() -> bool:
     wheels = _wheels_dir()
     if not os.path.isdir(wheels):
         return False
+    # A prior successful install from these exact wheels means pip would be
+    # a multi-second no-op; skip it
+    if _install_is_cached():
+        return True
     vendor = _vendor_dir()
     os.makedirs(vendor, exist_ok=True)
-    # Ensure pip is available
-    try:
-        subprocess.check_call([sys.executable, "-m", "ensurepip", "--upgrade"])  # noqa: S603
-    except Exception:
-        pass
+    # Blender ships with pip; only bootstrap it when actually missing
+    if importlib.util.find_spec("pip") is None:
+        try:
+            subprocess.check_call([sys.executable, "-m", "ensurepip", "--upgrade"])  # noqa: S603
+        except Exception:
+            pass
 
+    # The wheelhouse is curated and prebuilt, so skip the resolver work:
+    # no version check, no build isolation, no dependency resolution
     cmd = [
         sys.executable,
         "-m",
         "pip",
         "install",
         "--no-index",
+        "--disable-pip-version-check",
+        "--no-build-isolation",
         "--find-links",
         wheels,
         "-t",
@@ -69,6 +109,7 @@ def install_from_wheels() -> bool:
     ]
     try:
         subprocess.check_call(cmd)  # noqa: S603
+        _record_install()
         return True
     except Exception:
         return False
@@ -22,18 +22,7 @@ import argparse
 import sys
 import can
 
-def parse_int(x: str) -> int:
-    """Parse either decimal or hex strings like 0x7F."""
-    return int(x, 0)
-
-def build_ext_id(msg_type: int, host_id: int, motor_id: int) -> int:
-    """
-    Extended 29-bit CAN ID layout (from RobStride docs):
-      bits 28-24 : mode (5 bits)
-      bits 23-8  : host/master ID (16 bits)
-      bits 7-0   : motor node ID (8 bits)
-    """
-    return ((msg_type & 0x1F) << 24) | ((host_id & 0xFFFF) << 8) | (motor_id & 0xFF)
+from frames import build_ext_id, close_buses, open_bus, parse_int
 
 def main():
     parser = argparse.ArgumentParser(description="Disable / stop a RobStride motor over CAN.")
@@ -64,7 +53,7 @@ def main():
     data = bytes(8)  # 8 zero bytes
 
     try:
-        bus = can.interface.Bus(channel=args.iface, bustype="socketcan", bitrate=args.bitrate)
+        bus = open_bus(args.iface, args.bitrate)
     except Exception as e:
         print(f"[ERROR] Could not open {args.iface}: {e}")
         sys.exit(1)
@@ -76,10 +65,7 @@ def main():
         bus.send(msg)
         print("[OK] Disable/STOP frame sent.")
     finally:
-        try:
-            bus.shutdown()
-        except Exception:
-            pass
+        close_buses()
 
 if __name__ == "__main__":
     main()
@@ -22,12 +22,11 @@ import sys
 import time
 import can
 
-def parse_int(x: str) -> int:
-    return int(x, 0)
+from frames import build_ext_id, close_buses, open_bus, parse_int
 
-def build_ext_id(msg_type: int, host_id: int, motor_id: int) -> int:
-    # 29-bit ID layout: [ mode(5) | host_id(16) | motor_id(8) ]
-    return ((msg_type & 0x1F) << 24) | ((host_id & 0xFFFF) << 8) | (motor_id & 0xFF)
+# Type=0x12 write payload: run_mode (0x7005) = 1, precomputed so each
+# invocation skips the hex parsing
+RUN_MODE_PAYLOAD = b'\x05\x70\x00\x00\x01\x00\x00\x00'
 
 def main():
     ap = argparse.ArgumentParser(description="Enable a RobStride motor via CAN.")
@@ -54,14 +53,14 @@ def main():
 
     # Frame 1: Type 0x12 (write), payload 05 70 00 00 01 00 00 00
     arb_write = build_ext_id(0x12, host_id, motor_id)
-    data_write = bytes.fromhex("05 70 00 00 01 00 00 00")
+    data_write = RUN_MODE_PAYLOAD
 
     # Frame 2: Type 0x03 (enable), payload all zeros
     arb_enable = build_ext_id(0x03, host_id, motor_id)
     data_enable = bytes(8)
 
     try:
-        bus = can.interface.Bus(channel=args.iface, bustype="socketcan", bitrate=args.bitrate)
+        bus = open_bus(args.iface, args.bitrate)
     except Exception as e:
         print(f"[ERROR] Could not open {args.iface}: {e}")
         sys.exit(1)
@@ -83,10 +82,7 @@ def main():
 
         print("[OK] Enable frames sent.")
     finally:
-        try:
-            bus.shutdown()
-        except Exception:
-            pass
+        close_buses()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+frames.py — Shared CAN helpers for the RobStride CLI scripts
+
+enable.py, disable.py and move.py used to each carry their own copies of
+parse_int/build_ext_id and open a fresh SocketCAN bus per invocation. The
+helpers live here now, and open_bus() caches one bus per (iface, bitrate)
+so scripted multi-frame sequences pay the socket()/bind() bringup once.
+"""
+
+import can
+
+# One bus per (iface, bitrate); closed together via close_buses()
+_buses = {}
+
+
+def parse_int(x: str) -> int:
+    """Parse decimal or 0x.. hex."""
+    return int(x, 0)
+
+
+def build_ext_id(msg_type: int, host_id: int, motor_id: int) -> int:
+    """
+    Extended 29-bit ID layout (from RobStride docs):
+      bits 28-24 : mode (5 bits)
+      bits 23-8  : host/master ID (16 bits)
+      bits 7-0   : motor node ID (8 bits)
+    """
+    return ((msg_type & 0x1F) << 24) | ((host_id & 0xFFFF) << 8) | (motor_id & 0xFF)
+
+
+def open_bus(iface: str = "can0", bitrate: int = 1_000_000):
+    """Open a SocketCAN bus, reusing a previously opened one when possible."""
+    key = (iface, bitrate)
+    bus = _buses.get(key)
+    if bus is None:
+        bus = can.interface.Bus(channel=iface, bustype="socketcan", bitrate=bitrate)
+        _buses[key] = bus
+    return bus
+
+
+def close_buses() -> None:
+    """Shut down every cached bus; call once at program exit."""
+    while _buses:
+        _key, bus = _buses.popitem()
+        try:
+            bus.shutdown()
+        except Exception:
+            pass
+
+
+def send_frames(bus, frames) -> None:
+    """Send an iterable of (arbitration_id, data) pairs on an open bus."""
+    for arb_id, data in frames:
+        bus.send(can.Message(arbitration_id=arb_id, is_extended_id=True, data=data))
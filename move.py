@@ -4,10 +4,12 @@ move.py — Send a RobStride target position (degrees) over CAN
 
 Usage:
   sudo python3 move.py <motor_id> <degrees> [host_id]
+  sudo python3 move.py --batch < targets.txt
 
 Examples:
   sudo python3 move.py 127 90
   sudo python3 move.py 0x7F 45 0x0000   # custom master/host ID 0x0000
+  printf '1 90\n2 -45\n' | sudo python3 move.py --batch
 
 Notes:
 - motor_id is the node ID (0–127).
@@ -15,6 +17,8 @@ Notes:
 - Sends a Type=0x12 (single-parameter write) frame with data:
     16 70 00 00 <float32 LE radians>
   (index 0x7016 in little-endian byte order = loc_ref)
+- Batch mode reads "motor_id degrees" lines from stdin and reuses one bus
+  for the whole run, so per-command socket bringup is paid once.
 """
 
 import argparse
@@ -25,31 +29,129 @@ import subprocess
 import sys
 import can
 
-def parse_int(x: str) -> int:
-    """Parse decimal or 0x.. hex."""
-    return int(x, 0)
+from frames import build_ext_id, close_buses, open_bus, parse_int
 
-def build_ext_id(msg_type: int, host_id: int, motor_id: int) -> int:
-    """
-    Extended 29-bit ID layout from your working frames:
-      [ mode(5) | host_id(16) | motor_id(8) ]
+# Index 0x7016 (loc_ref) in little-endian byte order
+LOC_REF_INDEX = bytes([0x16, 0x70, 0x00, 0x00])
+_PACK_F32 = struct.Struct("<f").pack
+
+
+def loc_ref_frame(host_id: int, motor_id: int, degrees: float):
+    """Return (arbitration_id, data) for a loc_ref write in degrees."""
+    radians = degrees * math.pi / 180.0
+    arb_id = build_ext_id(0x12, host_id, motor_id)
+    return arb_id, LOC_REF_INDEX + _PACK_F32(radians)
+
+
+def move_many(bus, host_id: int, motor_ids, degrees) -> int:
+    """Send loc_ref writes for many motors in one call.
+
+    Payload packing is vectorized with NumPy when available: one C-level
+    degrees->radians conversion plus a single (N, 8) uint8 payload buffer,
+    leaving only bus.send per frame. Returns the number of frames sent.
     """
-    return ((msg_type & 0x1F) << 24) | ((host_id & 0xFFFF) << 8) | (motor_id & 0xFF)
+    try:
+        import numpy as np
+    except Exception:
+        np = None
+    if np is None:
+        for mid, deg in zip(motor_ids, degrees):
+            arb_id, data = loc_ref_frame(host_id, int(mid), float(deg))
+            bus.send(can.Message(arbitration_id=arb_id, is_extended_id=True, data=data))
+        return len(motor_ids)
+
+    ids = np.asarray(motor_ids, dtype=np.uint32)
+    rad = np.asarray(degrees, dtype=np.float32) * np.float32(math.pi / 180.0)
+    arb_ids = (0x12 << 24) | ((host_id & 0xFFFF) << 8) | (ids & 0xFF)
+    buf = np.empty((len(ids), 8), dtype=np.uint8)
+    buf[:, 0] = 0x16
+    buf[:, 1] = 0x70
+    buf[:, 2:4] = 0
+    buf[:, 4:].view(np.float32)[:, 0] = rad
+    payload = buf.tobytes()
+    for i, arb in enumerate(arb_ids):
+        bus.send(can.Message(arbitration_id=int(arb), is_extended_id=True,
+                             data=payload[i * 8:(i + 1) * 8]))
+    return len(ids)
+
+
+def maybe_run_enable_sh(motor_id: int) -> None:
+    """Run ./enable.sh like the original bash workflow, if present."""
+    if os.path.isfile("./enable.sh") and os.access("./enable.sh", os.X_OK):
+        try:
+            # Try passing motor_id; fall back to plain call if that fails
+            subprocess.run(["./enable.sh", str(motor_id)], check=True)
+        except subprocess.CalledProcessError:
+            try:
+                subprocess.run(["./enable.sh"], check=False)
+            except Exception:
+                pass
+
+
+def run_batch(args, host_id: int) -> None:
+    """Read "motor_id degrees" lines from stdin over one shared bus."""
+    try:
+        bus = open_bus(args.iface, args.bitrate)
+    except Exception as e:
+        print(f"[ERROR] Could not open {args.iface}: {e}")
+        sys.exit(1)
+
+    # enable.sh is invoked at most once per motor for the whole batch
+    enabled = set()
+    sent = 0
+    try:
+        for line in sys.stdin:
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            try:
+                motor_id = parse_int(parts[0])
+                degrees = float(parts[1])
+            except (IndexError, ValueError) as e:
+                print(f"[ERROR] {line.strip()!r}: {e}")
+                continue
+            if not args.no_enable and motor_id not in enabled:
+                maybe_run_enable_sh(motor_id)
+                enabled.add(motor_id)
+            arb_id, data = loc_ref_frame(host_id, motor_id, degrees)
+            bus.send(can.Message(arbitration_id=arb_id, is_extended_id=True, data=data))
+            sent += 1
+        print(f"[OK] {sent} frame(s) sent.")
+    finally:
+        close_buses()
+
 
 def main():
     ap = argparse.ArgumentParser(description="Send RobStride target position (degrees) over CAN.")
-    ap.add_argument("motor_id", help="Motor/node ID (dec or 0x..)")
-    ap.add_argument("degrees",  help="Target position in degrees (float)")
+    ap.add_argument("motor_id", nargs="?", help="Motor/node ID (dec or 0x..)")
+    ap.add_argument("degrees", nargs="?", help="Target position in degrees (float)")
     ap.add_argument("host_id",  nargs="?", default="0x00AA", help="Host/master ID (16-bit, default 0x00AA)")
     ap.add_argument("--iface",  default="can0", help='CAN interface (default "can0")')
     ap.add_argument("--bitrate", type=int, default=1_000_000, help="Bitrate (default 1000000)")
     ap.add_argument("--no-enable", action="store_true", help="Do not try to call ./enable.sh before sending")
+    ap.add_argument("--batch", action="store_true", help='Read "motor_id degrees" lines from stdin')
     args = ap.parse_args()
 
     # Parse/validate inputs
+    try:
+        host_id = parse_int(args.host_id)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    if not (0 <= host_id <= 0xFFFF):
+        print("Error: host_id must be 0..65535 (16-bit)")
+        sys.exit(1)
+
+    if args.batch:
+        run_batch(args, host_id)
+        return
+
+    if args.motor_id is None or args.degrees is None:
+        print("Error: motor_id and degrees are required unless --batch is given")
+        sys.exit(1)
+
     try:
         motor_id = parse_int(args.motor_id)
-        host_id  = parse_int(args.host_id)
         degrees  = float(args.degrees)
     except ValueError as e:
         print(f"[ERROR] {e}")
@@ -58,34 +160,17 @@ def main():
     if not (0 <= motor_id <= 255):
         print("Error: motor_id must be 0..255")
         sys.exit(1)
-    if not (0 <= host_id <= 0xFFFF):
-        print("Error: host_id must be 0..65535 (16-bit)")
-        sys.exit(1)
 
+    arb_id, data = loc_ref_frame(host_id, motor_id, degrees)
     radians = degrees * math.pi / 180.0
-    rad_bytes = struct.pack("<f", radians)  # little-endian float32
-
-    # Extended ID for Type=0x12 (single param write): 0x12{HOST16}{MOTOR8}
-    arb_id = build_ext_id(0x12, host_id, motor_id)
-
-    # Data payload: 16 70 00 00 <float32 LE radians>
-    # (index 0x7016 in little endian)
-    data = bytes([0x16, 0x70, 0x00, 0x00]) + rad_bytes
 
     # Optionally run enable.sh like your bash script
-    if not args.no_enable and os.path.isfile("./enable.sh") and os.access("./enable.sh", os.X_OK):
-        try:
-            # Try passing motor_id; fall back to plain call if that fails
-            subprocess.run(["./enable.sh", str(motor_id)], check=True)
-        except subprocess.CalledProcessError:
-            try:
-                subprocess.run(["./enable.sh"], check=False)
-            except Exception:
-                pass
+    if not args.no_enable:
+        maybe_run_enable_sh(motor_id)
 
     # Open CAN and send
     try:
-        bus = can.interface.Bus(channel=args.iface, bustype="socketcan", bitrate=args.bitrate)
+        bus = open_bus(args.iface, args.bitrate)
     except Exception as e:
         print(f"[ERROR] Could not open {args.iface}: {e}")
         sys.exit(1)
@@ -98,10 +183,7 @@ def main():
         bus.send(msg)
         print("[OK] Frame sent.")
     finally:
-        try:
-            bus.shutdown()
-        except Exception:
-            pass
+        close_buses()
 
 if __name__ == "__main__":
     main()
@@ -9,23 +9,140 @@ exposes a stub implementation for development/testing without hardware.
 from __future__ import annotations
 
 import math
+import os
+from array import array
+import struct
 import time
-from typing import Any, Dict, List
+from time import monotonic_ns as _mono_ns
+from typing import Any, Dict, List, Tuple
 import threading
 import queue
 
-try:
-    import can  # type: ignore
-except Exception:  # pragma: no cover - optional
-    can = None  # type: ignore
-try:
-    import canopen  # type: ignore
-except Exception:  # pragma: no cover - optional
-    canopen = None  # type: ignore
-try:
-    import robstride as robstride_lib  # type: ignore
-except Exception:  # pragma: no cover - optional
-    robstride_lib = None  # type: ignore
+# Backend libraries are imported lazily on the first connect so enabling the
+# addon (or a pure-simulation session) does not pay their import cost. Every
+# call site already guards on `can is not None` etc., which stays correct:
+# the names remain None until _load_backends() runs.
+can = None  # type: ignore
+canopen = None  # type: ignore
+robstride_lib = None  # type: ignore
+_backends_loaded = False
+
+
+def _load_backends() -> None:
+    global can, canopen, robstride_lib, _backends_loaded
+    if _backends_loaded:
+        return
+    _backends_loaded = True
+    try:
+        import can as _can  # type: ignore
+        can = _can
+    except Exception:  # pragma: no cover - optional
+        pass
+    try:
+        import canopen as _canopen  # type: ignore
+        canopen = _canopen
+    except Exception:  # pragma: no cover - optional
+        pass
+    try:
+        import robstride as _robstride  # type: ignore
+        robstride_lib = _robstride
+    except Exception:  # pragma: no cover - optional
+        pass
+
+# Precompiled packers and fixed payloads for the CANopen send paths; parsing
+# a struct format string per call costs more than the few payload bytes.
+_S_F32 = struct.Struct('<f')
+_S_I32 = struct.Struct('<i')
+_S_U32 = struct.Struct('<I')
+_S_U16 = struct.Struct('<H')
+_PACK_F32 = _S_F32.pack
+_PACK_I32 = _S_I32.pack
+_PACK_U32 = _S_U32.pack
+_PACK_U16 = _S_U16.pack
+# Controlword + target position as carried by the mapped RPDO1 frame
+_S_CW_POS = struct.Struct('<Hi')
+# Full 8-byte read-request payload (index + six zero bytes) in one pack call
+_PACK_READ_REQ = struct.Struct('<H6x').pack
+# Full write payloads (index, two zero bytes, value) in one pack call for
+# the raw-socket TX path, which takes bytes rather than a can.Message
+_PACK_WRITE_U32 = struct.Struct('<H2xI').pack
+_PACK_WRITE_F32 = struct.Struct('<H2xf').pack
+# Kernel can_frame layout (id, dlc, pad, data) for the direct AF_CAN path
+_PACK_FRAME = struct.Struct('=IB3x8s').pack
+_CAN_EFF_FLAG = 0x80000000
+# Setpoints within this of the last transmitted value are not resent (rad)
+_RESEND_EPS = 1e-4
+# Default per-node floor between position sends so a fast producer cannot
+# saturate the bus (a classic frame is ~110 us at 1 Mbit/s); adjustable per
+# session via set_min_send_interval()
+_MIN_SEND_INTERVAL_S = 0.005
+
+_CW_ENABLE = b'\x0f\x00'    # controlword 0x000F
+_CW_SHUTDOWN = b'\x06\x00'  # controlword 0x0006
+_MODE_PP = b'\x01'          # modes-of-operation: Profile Position
+
+# 256-entry sine table for the simulation jitter; turns the per-read
+# transcendental call into a mask + indexed load
+_SIN_TAB = array('d', (math.sin(i * 2.0 * math.pi / 256.0) for i in range(256)))
+
+# Probe set for quick scans and the stub node list, hoisted so scan() does
+# not rebuild them per invocation.
+_COMMON_PROBE_IDS = (1, 2, 10, 42, 100, 120, 127)
+_SIM_NODES = (
+    {"id": 1, "name": "Sim node 1"},
+    {"id": 2, "name": "Sim node 2"},
+)
+
+# sendmmsg(2) resolved lazily through ctypes: Python's socket module has no
+# multi-message send, so a burst of N frames otherwise costs N write
+# syscalls on the raw TX socket. Set to False once resolution has failed
+# (non-Linux libc, missing symbol) so it is only attempted once.
+_sendmmsg = None
+
+
+def _resolve_sendmmsg():
+    global _sendmmsg
+    if _sendmmsg is not None:
+        return _sendmmsg
+    try:
+        import ctypes
+
+        class _Iovec(ctypes.Structure):
+            _fields_ = [('iov_base', ctypes.c_void_p),
+                        ('iov_len', ctypes.c_size_t)]
+
+        class _Msghdr(ctypes.Structure):
+            _fields_ = [('msg_name', ctypes.c_void_p),
+                        ('msg_namelen', ctypes.c_uint),
+                        ('msg_iov', ctypes.POINTER(_Iovec)),
+                        ('msg_iovlen', ctypes.c_size_t),
+                        ('msg_control', ctypes.c_void_p),
+                        ('msg_controllen', ctypes.c_size_t),
+                        ('msg_flags', ctypes.c_int)]
+
+        class _Mmsghdr(ctypes.Structure):
+            _fields_ = [('msg_hdr', _Msghdr),
+                        ('msg_len', ctypes.c_uint)]
+
+        _libc_sendmmsg = ctypes.CDLL(None, use_errno=True).sendmmsg
+
+        def _send_frames(fd: int, frames) -> int:
+            n = len(frames)
+            bufs = [ctypes.create_string_buffer(f, len(f)) for f in frames]
+            iovs = (_Iovec * n)()
+            hdrs = (_Mmsghdr * n)()
+            for i in range(n):
+                iovs[i].iov_base = ctypes.cast(bufs[i], ctypes.c_void_p)
+                iovs[i].iov_len = len(frames[i])
+                hdrs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+                hdrs[i].msg_hdr.msg_iovlen = 1
+            return _libc_sendmmsg(fd, hdrs, n, 0)
+
+        _sendmmsg = _send_frames
+    except Exception:
+        _sendmmsg = False
+    return _sendmmsg
+
 
 class RobStrideManager:
     def __init__(self):
@@ -35,15 +152,39 @@ class RobStrideManager:
         self._bus = None
         self._co_net = None
         self._nodes = {}
-        self._stub_last: Dict[int, float] = {}
-        self._stub_phase = 0.0
+        # Stub targets indexed by node id: a flat double array turns the
+        # per-tick base lookup into a C index op instead of a dict probe
+        self._stub_last = array('d', [0.0]) * 256
+        self._stub_idx = 0
         self.simulate = False
         self.connected = False
         self._rs_client = None
         self._enabled_nodes = set()
         self._pos_mode_nodes = set()
+        # CANopen per-node state: Profile Position mode set, last controlword
+        self._co_pp_nodes = set()
+        self._co_last_cw: Dict[int, int] = {}
+        # Prebuilt RPDO1 frames (controlword + target position mapped into
+        # one unacknowledged PDO) and nodes whose devices rejected the mapping
+        self._rpdo_frames: Dict[int, Any] = {}
+        self._rpdo_failed: set = set()
+        # Kernel-side cyclic TX (SocketCAN BCM) per node for the loc_ref
+        # stream; False once send_periodic is known to be unsupported
+        self._periodic_tasks: Dict[int, Any] = {}
+        self._periodic_ok = True
+        # Precomputed raw-write frames keyed by (host, node, index): the
+        # arbitration ID and payload prefix never change for a session, so a
+        # hot write only packs the value into the cached message's data
+        self._raw_tx_templates: Dict[tuple, Any] = {}
+        # Resolved at connect()/disconnect(); stub while disconnected
+        self._send_position_impl = self._send_position_stub
         # Raw RobStride protocol addressing (from candump): host 0x7F, node_id is 1 byte
         self._host_addr = 0x7F
+        # Memoized arbitration IDs keyed (cmd, src, dest); host changes miss
+        # naturally because src is resolved before the lookup
+        self._id_cache: Dict[tuple, int] = {}
+        # Direct AF_CAN TX socket (socketcan only); None elsewhere
+        self._raw_sock = None
         # Scan options
         self._scan_min_id = 1
         self._scan_max_id = 127
@@ -51,12 +192,51 @@ class RobStrideManager:
         # Async worker state
         self._worker_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._pending_pos: Dict[int, float] = {}
-        self._pending_reads: set[int] = set()
+        # Positions and read requests flow through C-implemented SimpleQueues
+        # so the frame handler never takes a Python-level lock; the worker
+        # coalesces to the newest value per node while draining. The rare
+        # click-driven pid/enable posts stay under self._lock.
+        self._pending_pos_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_reads_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_enable: Dict[int, bool] = {}
+        self._pending_pid: Dict[int, tuple] = {}
         self._last_read_pos: Dict[int, float] = {}
+        # Per-node floor between issued reads: UI code may ask several times
+        # per tick and the answer cannot change faster than the bus round trip
+        self._read_ttl_ns = 10_000_000
+        self._read_req_ns: Dict[int, int] = {}
+        self._last_sent_pos: Dict[int, float] = {}
+        self._last_send_ts: Dict[int, float] = {}
+        # Worker token-bucket floor; scene settings may override the default
+        self._min_send_interval_s = _MIN_SEND_INTERVAL_S
+        # Position writes to a freshly enabled node are held back until this
+        # monotonic_ns deadline so the motor can settle; replaces the old
+        # in-line 20 ms sleep that stalled the whole worker
+        self._enable_ready_ns: Dict[int, int] = {}
         self._lock = threading.Lock()
+        # Producers set this after enqueuing so the worker wakes immediately
+        # instead of polling on a fixed sleep
+        self._work_event = threading.Event()
+        # Worker failures print a traceback at most once per second rather
+        # than being swallowed outright
+        self._last_err_ns = 0
+        # Background RX: a can.Notifier demuxes response frames as they
+        # arrive so reads stop polling recv() on the requesting thread
+        self._rx_notifier = None
+        self._rx_param: Dict[tuple, bytes] = {}
+        self._rx_event = threading.Event()
+        # Optional pause between batched position writes so bursty frames do
+        # not overrun slow adapters (0 = write back-to-back)
+        self._batch_pace_s = 0.0
         # Prefer raw protocol by default to mirror working scripts
         self._prefer_vendor = False
+        # Optional realtime scheduling for the worker thread (Linux only,
+        # needs CAP_SYS_NICE); off by default so headless/CI paths skip it
+        self._prefer_rt = False
+        # Discovered on connect; True when the channel accepted fd=True
+        self.canfd = False
+        self._rt_cpu: int | None = None
+        self._rt_prio = 80
 
     # Public API used by the add-on
     def configure(self, interface: str, channel: str, bitrate: int) -> None:
@@ -68,6 +248,86 @@ class RobStrideManager:
     def set_prefer_vendor(self, value: bool) -> None:
         self._prefer_vendor = bool(value)
 
+    def _probe_ids_pipelined(self, probe_ids, timeout_s: float = 0.25) -> set:
+        """Burst mechpos reads for all candidate ids, then reap the replies.
+
+        The serial probe paid its reply timeout per id; here every 0x11
+        request goes out back-to-back and one drain window collects the
+        responses, matched back to node ids by arbitration ID, so wall time
+        is transmit time plus a single timeout regardless of range size.
+        """
+        found: set = set()
+        if self._bus is None or can is None:
+            return found
+        expected = {
+            self._rs_make_id(0x11, self._host_addr, src=int(nid)): int(nid)
+            for nid in probe_ids
+        }
+        if not expected:
+            return found
+        # One masked acceptance filter for the whole burst: cmd=0x11,
+        # middle byte zero, dst=host, any src. Kernel-side, so unrelated
+        # traffic never reaches Python, and a single setsockopt replaces
+        # one filter swap per candidate id.
+        self._apply_filters_and_flush([{
+            "can_id": (0x11 << 24) | (self._host_addr & 0xFF),
+            "can_mask": 0x1FFF00FF,
+            "extended": True,
+        }])
+        payload = _PACK_READ_REQ(0x7019)
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        try:
+            if self._rx_notifier is not None:
+                # The notifier owns recv(); burst the requests and watch the
+                # dispatch cache fill in
+                pending = set(expected.values())
+                for nid in pending:
+                    self._rx_param.pop((nid, 0x7019), None)
+                if not self._rs_raw_send_burst(list(pending), 0x11, payload):
+                    for nid in pending:
+                        try:
+                            self._rs_raw_send(0x11, nid, payload)
+                        except Exception:
+                            pass
+                while pending and time.monotonic() < deadline:
+                    self._rx_event.wait(0.005)
+                    self._rx_event.clear()
+                    for nid in list(pending):
+                        raw = self._rx_param.get((nid, 0x7019))
+                        if raw is None:
+                            continue
+                        pending.discard(nid)
+                        try:
+                            if not math.isnan(_S_F32.unpack(raw)[0]):
+                                found.add(nid)
+                        except Exception:
+                            pass
+            else:
+                self._flush_bus(0.05)
+                if not self._rs_raw_send_burst(list(expected.values()), 0x11, payload):
+                    for nid in expected.values():
+                        try:
+                            self._rs_raw_send(0x11, nid, payload)
+                        except Exception:
+                            pass
+                deadline_ns = _mono_ns() + int((deadline - time.monotonic()) * 1e9)
+                for arb_id, data in self._drain_matching(expected, deadline_ns):
+                    nid = expected.pop(arb_id)
+                    if len(data) != 8 or data[:2] != payload[:2]:
+                        continue
+                    try:
+                        if not math.isnan(_S_F32.unpack_from(data, 4)[0]):
+                            found.add(nid)
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+        try:
+            self._bus.set_filters(self._standing_filters())
+        except Exception:
+            pass
+        return found
+
     def scan(self) -> List[Dict[str, Any]]:
         # If connected, collect real nodes; if simulate is enabled, always include simulated nodes too
         results: List[Dict[str, Any]] = []
@@ -78,10 +338,10 @@ class RobStrideManager:
             if robstride_lib is not None and self._prefer_vendor:
                 try:
                     nodes = robstride_lib.scan(interface=self.interface, channel=self.channel, bitrate=self.bitrate)
-                    for m in nodes:
-                        nid = int(m.get("id", 0))
-                        if nid not in vendor_candidates:
-                            vendor_candidates.append(nid)
+                    # dict.fromkeys dedups in C while keeping discovery order
+                    vendor_candidates = list(dict.fromkeys(
+                        int(m.get("id", 0)) for m in nodes
+                    ))
                 except Exception:
                     vendor_candidates = []
 
@@ -90,37 +350,21 @@ class RobStrideManager:
                 try:
                     self._co_net.scanner.search()
                     time.sleep(0.5)
+                    seen = set(vendor_candidates)
                     for nid in list(self._co_net.scanner.nodes):
-                        vendor_candidates.append(int(nid))
+                        if int(nid) not in seen:
+                            seen.add(int(nid))
+                            vendor_candidates.append(int(nid))
                 except Exception:
                     pass
 
-            # Verify candidates via raw read when possible (single read, like scan_nodes.py)
+            # Verify candidates via a pipelined raw probe when possible
             if vendor_candidates and self._bus is not None and can is not None:
-                try:                    
-                    self._flush_bus(0.05)
-                    for nid in vendor_candidates:
-                        try:
-                            expect_id = self._rs_make_id(0x11, self._host_addr, src=int(nid))
-                            try:
-                                self._bus.set_filters([
-                                    {"can_id": expect_id, "can_mask": 0x1FFFFFFF, "extended": True}
-                                ])
-                            except Exception:
-                                pass
-                            v1 = self._rs_raw_read_param_f32(nid, 0x7019, timeout_s=0.03)
-                        except Exception:
-                            v1 = None
-                        if (v1 is not None and not math.isnan(v1)):
-                            if nid not in real_ids:
-                                real_ids.add(nid)
-                                results.append({"id": nid, "name": f"Node {nid}"})
-                    try:
-                        self._bus.set_filters(None)
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
+                verified = self._probe_ids_pipelined(vendor_candidates)
+                for nid in vendor_candidates:
+                    if nid in verified and nid not in real_ids:
+                        real_ids.add(nid)
+                        results.append({"id": nid, "name": f"Node {nid}"})
             elif vendor_candidates:
                 # No raw bus to verify; accept vendor results
                 for nid in vendor_candidates:
@@ -128,56 +372,34 @@ class RobStrideManager:
                         real_ids.add(nid)
                         results.append({"id": nid, "name": f"Node {nid}"})
 
-            # Raw protocol probe (single read per ID), like scan_nodes.py
+            # Raw protocol probe (mechpos read per ID), pipelined in one burst
             if self._bus is not None and can is not None and not results:
-                try:
-                    # Drain any pending frames to avoid matching stale responses
-                    self._flush_bus(0.05)
-                    # Probe a reasonable address range quickly using a short timeout per ID
-                    # Using mechpos (0x7019) single read to verify presence
-                    min_id = max(0, int(self._scan_min_id))
-                    max_id = min(127, int(self._scan_max_id))
-                    if not self._scan_quick:
-                        probe_ids = range(min_id, max_id + 1)
-                    else:
-                        common = (1, 2, 10, 42, 100, 120, 127)
-                        probe_ids = [i for i in common if min_id <= i <= max_id]
-                    for nid in probe_ids:
-                        try:
-                            # Temporarily filter to the exact expected response ID to avoid noise
-                            expect_id = self._rs_make_id(0x11, self._host_addr, src=int(nid))
-                            try:
-                                self._bus.set_filters([
-                                    {"can_id": expect_id, "can_mask": 0x1FFFFFFF, "extended": True}
-                                ])
-                            except Exception:
-                                pass
-                            val1 = self._rs_raw_read_param_f32(nid, 0x7019, timeout_s=0.03)
-                        except Exception:
-                            val1 = None
-                        if (val1 is not None and not math.isnan(val1)):
-                            real_ids.add(nid)
-                            results.append({"id": nid, "name": f"Node {nid}"})
-                    # Clear filters
-                    try:
-                        self._bus.set_filters(None)
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
+                min_id = max(0, int(self._scan_min_id))
+                max_id = min(127, int(self._scan_max_id))
+                if not self._scan_quick:
+                    probe_ids = range(min_id, max_id + 1)
+                else:
+                    probe_ids = [i for i in _COMMON_PROBE_IDS if min_id <= i <= max_id]
+                for nid in sorted(self._probe_ids_pipelined(probe_ids)):
+                    real_ids.add(nid)
+                    results.append({"id": nid, "name": f"Node {nid}"})
 
         # If simulation toggle is on, add simulated nodes (deduplicated)
         if self.simulate:
-            sim_nodes = [
-                {"id": 1, "name": "Sim node 1"},
-                {"id": 2, "name": "Sim node 2"},
-            ]
-            for m in sim_nodes:
+            for m in _SIM_NODES:
                 if int(m["id"]) not in real_ids:
-                    results.append(m)
+                    results.append(dict(m))
 
         return results
 
+    def set_batch_pace(self, ms: float) -> None:
+        self._batch_pace_s = max(0.0, float(ms)) / 1000.0
+
+    def set_min_send_interval(self, ms: float) -> None:
+        # Floor for the worker's per-node token bucket; values arriving
+        # faster are deferred (newest wins), never dropped
+        self._min_send_interval_s = max(0.0, float(ms)) / 1000.0
+
     def set_scan_options(self, min_id: int | None = None, max_id: int | None = None, quick: bool | None = None) -> None:
         if min_id is not None:
             self._scan_min_id = max(0, int(min_id))
@@ -188,13 +410,132 @@ class RobStrideManager:
         if quick is not None:
             self._scan_quick = bool(quick)
 
+    def _drain_matching(self, expected, deadline_ns: int):
+        """Yield (arbitration_id, data) for frames whose id is in expected.
+
+        One select() wait fetches every ready frame in a batch instead of a
+        blocking recv per frame; exits when the deadline passes or the
+        caller has emptied expected. Fallback path only - while the
+        notifier runs it owns recv().
+        """
+        fd = getattr(self._bus, 'fileno', None)
+        fileno = None
+        if fd is not None:
+            try:
+                import select
+                fileno = fd()
+            except Exception:
+                fileno = None
+        while expected and _mono_ns() < deadline_ns:
+            if fileno is not None:
+                remaining = (deadline_ns - _mono_ns()) * 1e-9
+                readable, _, _ = select.select([fileno], [], [], min(remaining, 0.005))
+                if not readable:
+                    continue
+                while expected:
+                    msg = self._bus.recv(timeout=0)
+                    if msg is None:
+                        break
+                    if msg.is_extended_id and int(msg.arbitration_id) in expected:
+                        yield int(msg.arbitration_id), bytes(msg.data)
+            else:
+                msg = self._bus.recv(timeout=0.005)
+                if msg is None or not msg.is_extended_id:
+                    continue
+                if int(msg.arbitration_id) in expected:
+                    yield int(msg.arbitration_id), bytes(msg.data)
+
+    def _standing_filters(self):
+        # Everything this bus ever consumes carries the host address in the
+        # low ID byte (RobStride read responses and vendor-client feedback
+        # alike); the CANopen network runs on its own socket. Accepting only
+        # those frames drops unrelated bus traffic in the kernel, so it
+        # never costs a syscall or a Message allocation in Python.
+        return [{
+            "can_id": self._host_addr & 0xFF,
+            "can_mask": 0xFF,
+            "extended": True,
+        }]
+
+    def _apply_filters_and_flush(self, filters) -> None:
+        # socketcan can deliver frames that were queued before a filter
+        # change took effect; drain right after applying so stale frames
+        # cannot be mistaken for probe replies
+        try:
+            self._bus.set_filters(filters)
+        except Exception:
+            return
+        self._flush_bus(0.005)
+
+    def _on_can_msg(self, msg) -> None:
+        # Notifier callback (notifier thread). Demux RobStride read
+        # responses (0x11 00 <node> <host>) into the parameter cache;
+        # mechpos replies also land straight in the position cache.
+        try:
+            if not msg.is_extended_id or msg.dlc != 8:
+                return
+            arb = int(msg.arbitration_id)
+            if (arb >> 24) & 0xFF != 0x11 or (arb & 0xFF) != self._host_addr:
+                return
+            node_id = (arb >> 8) & 0xFF
+            data = bytes(msg.data)
+            index = data[0] | (data[1] << 8)
+            self._rx_param[(node_id, index)] = data[4:8]
+            if index == 0x7019:
+                self._last_read_pos[node_id] = _S_F32.unpack_from(data, 4)[0]
+            self._rx_event.set()
+        except Exception:
+            pass
+
+    def _raw_read_wait(self, node_id: int, index: int, timeout_s: float) -> bytes | None:
+        # Issue a 0x11 read and wait for the notifier to deliver the reply
+        key = (int(node_id), int(index) & 0xFFFF)
+        self._rx_param.pop(key, None)
+        self._rx_event.clear()
+        self._rs_raw_send(0x11, key[0], _PACK_READ_REQ(key[1]))
+        deadline = _mono_ns() + int(max(0.0, float(timeout_s)) * 1e9)
+        # Short spin before parking on the event: replies typically land
+        # within tens of us of the request, and sleep(0) yields the GIL so
+        # the notifier thread can run the dispatch
+        for _ in range(64):
+            raw = self._rx_param.get(key)
+            if raw is not None:
+                return raw
+            time.sleep(0)
+        while True:
+            raw = self._rx_param.get(key)
+            if raw is not None:
+                return raw
+            remaining = deadline - _mono_ns()
+            if remaining <= 0:
+                return None
+            self._rx_event.wait(min(remaining * 1e-9, 0.005))
+            self._rx_event.clear()
+
     def _flush_bus(self, duration_s: float = 0.02) -> None:
         if self._bus is None or can is None:
             return
-        end = time.time() + max(0.0, float(duration_s))
+        if self._rx_notifier is not None:
+            # The notifier owns recv(); stale frames age out of its cache
+            return
         try:
+            # One zero-timeout poll per pending frame instead of 1 ms
+            # blocking recvs: an idle bus exits on the first select()
+            fd = getattr(self._bus, 'fileno', None)
+            if fd is not None:
+                import select
+                fileno = fd()
+                deadline = _mono_ns() + int(max(0.0, float(duration_s)) * 1e9)
+                while _mono_ns() < deadline:
+                    readable, _, _ = select.select([fileno], [], [], 0)
+                    if not readable:
+                        break
+                    if self._bus.recv(timeout=0) is None:
+                        break
+                return
+            deadline = _mono_ns() + int(max(0.0, float(duration_s)) * 1e9)
             # Do not alter filters here; just drain
-            while time.time() < end:
+            while _mono_ns() < deadline:
                 msg = self._bus.recv(timeout=0.001)
                 if msg is None:
                     break
@@ -216,10 +557,9 @@ class RobStrideManager:
         if self.connected and self._co_net is not None and canopen is not None and not self._prefer_vendor:
             try:
                 node = self._get_or_add_node(node_id)
-                import struct
-                node.sdo.download(0x3000, 0x00, struct.pack('<f', float(kp)))
-                node.sdo.download(0x3001, 0x00, struct.pack('<f', float(ki)))
-                node.sdo.download(0x3002, 0x00, struct.pack('<f', float(kd)))
+                node.sdo.download(0x3000, 0x00, _PACK_F32(float(kp)))
+                node.sdo.download(0x3001, 0x00, _PACK_F32(float(ki)))
+                node.sdo.download(0x3002, 0x00, _PACK_F32(float(kd)))
                 return
             except Exception:
                 pass
@@ -227,6 +567,11 @@ class RobStrideManager:
 
     def enable_node(self, node_id: int, enable: bool) -> None:
         # Prefer RobStride client; avoid re-enabling every frame
+        if not enable:
+            # A disabled motor may drift, so forget the last setpoint and
+            # let the next one after re-enable go out unconditionally
+            self._last_sent_pos.pop(node_id, None)
+            self._stop_periodic(node_id)
         if self.connected and robstride_lib is not None and self._rs_client is not None:
             try:
                 if enable and node_id not in self._enabled_nodes:
@@ -242,9 +587,7 @@ class RobStrideManager:
         if self.connected and self._co_net is not None and canopen is not None and not self._prefer_vendor:
             try:
                 node = self._get_or_add_node(node_id)
-                import struct
-                controlword = 0x000F if enable else 0x0006
-                node.sdo.download(0x6040, 0x00, struct.pack('<H', controlword))
+                node.sdo.download(0x6040, 0x00, _CW_ENABLE if enable else _CW_SHUTDOWN)
                 return
             except Exception:
                 pass
@@ -257,15 +600,12 @@ class RobStrideManager:
                 if enable:
                     # enable.py behavior: write run_mode=1 (0x7005) then Type=0x03 enable command
                     self._rs_raw_write_param_u32(node_id, 0x7005, 1)
-                    try:
-                        time.sleep(0.02)
-                    except Exception:
-                        pass
                     try:
                         self._rs_raw_send(0x03, int(node_id), bytes(8))
                     except Exception:
                         pass
                     self._enabled_nodes.add(node_id)
+                    self._enable_ready_ns[int(node_id)] = _mono_ns() + 20_000_000
                 else:
                     # disable.py behavior: Type=0x04 STOP command; also set run_mode=0
                     try:
@@ -281,52 +621,122 @@ class RobStrideManager:
                 pass
 
     def send_position(self, node_id: int, value: float) -> None:
+        # The backend chain head is resolved once per connect; each impl
+        # still falls back to the next on per-call failure.
+        self._send_position_impl(node_id, value)
+
+    def _select_send_path(self) -> None:
+        if not self.connected:
+            self._send_position_impl = self._send_position_stub
+        elif robstride_lib is not None and self._rs_client is not None:
+            self._send_position_impl = self._send_position_vendor
+        elif self._co_net is not None and canopen is not None and not self._prefer_vendor:
+            self._send_position_impl = self._send_position_canopen
+        else:
+            self._send_position_impl = self._send_position_raw
+
+    def _send_position_stub(self, node_id: int, value: float) -> None:
+        if self.simulate:
+            self._stub_last[node_id & 0xFF] = float(value)
+
+    def _send_position_vendor(self, node_id: int, value: float) -> None:
         # Prefer RobStride client; set Position mode once, then update loc_ref
-        if self.connected and robstride_lib is not None and self._rs_client is not None:
-            try:
-                if node_id not in self._pos_mode_nodes:
-                    self._rs_client.write_param(node_id, 'run_mode', robstride_lib.RunMode.Position)
-                    self._pos_mode_nodes.add(node_id)
-                self._rs_client.write_param(node_id, 'loc_ref', float(value))
-                return
-            except Exception:
-                pass
+        try:
+            if node_id not in self._pos_mode_nodes:
+                self._rs_client.write_param(node_id, 'run_mode', robstride_lib.RunMode.Position)
+                self._pos_mode_nodes.add(node_id)
+            self._rs_client.write_param(node_id, 'loc_ref', float(value))
+            return
+        except Exception:
+            pass
+        self._send_position_canopen(node_id, value)
 
-        if self.connected and self._co_net is not None and canopen is not None and not self._prefer_vendor:
-            try:
-                node = self._get_or_add_node(node_id)
-                import struct
-                node.sdo.download(0x6060, 0x00, struct.pack('<b', 1))
-                node.sdo.download(0x607A, 0x00, struct.pack('<i', int(value)))
+    def _setup_rpdo(self, node_id: int):
+        """Map Controlword + Target Position into RPDO1 for one node.
+
+        Configured once per node over SDO; afterwards a setpoint costs one
+        unacknowledged 6-byte PDO frame instead of SDO round trips. Returns
+        the prebuilt can.Message, or None when the device rejects the
+        remap (the SDO path below stays as the fallback).
+        """
+        if node_id in self._rpdo_failed or can is None or self._bus is None:
+            return None
+        try:
+            node = self._get_or_add_node(node_id)
+            cob_id = 0x200 + int(node_id)
+            sdo = node.sdo.download
+            # Disable the PDO (COB-ID bit 31) while remapping, per CiA 301
+            sdo(0x1400, 0x01, _PACK_U32(0x80000000 | cob_id))
+            sdo(0x1600, 0x00, b'\x00')
+            sdo(0x1600, 0x01, _PACK_U32(0x60400010))  # controlword, 16 bit
+            sdo(0x1600, 0x02, _PACK_U32(0x607A0020))  # target pos, 32 bit
+            sdo(0x1600, 0x00, b'\x02')
+            sdo(0x1400, 0x02, b'\xff')  # transmission type: async
+            sdo(0x1400, 0x01, _PACK_U32(cob_id))
+            msg = can.Message(arbitration_id=cob_id, is_extended_id=False,
+                              data=bytearray(6))
+            self._rpdo_frames[node_id] = msg
+            return msg
+        except Exception:
+            self._rpdo_failed.add(node_id)
+            return None
+
+    def _send_position_canopen(self, node_id: int, value: float) -> None:
+        if self._co_net is not None and canopen is not None and not self._prefer_vendor:
+            if node_id not in self._co_pp_nodes:
+                try:
+                    self._get_or_add_node(node_id).sdo.download(0x6060, 0x00, _MODE_PP)
+                    self._co_pp_nodes.add(node_id)
+                except Exception:
+                    pass
+            msg = self._rpdo_frames.get(node_id)
+            if msg is None:
+                msg = self._setup_rpdo(node_id)
+            if msg is not None:
                 try:
-                    cw_bytes = node.sdo.upload(0x6040, 0x00)
-                    cw = int.from_bytes(cw_bytes, 'little')
+                    # PP mode latches a setpoint on the rising edge of
+                    # controlword bit 4, so send the target with the bit
+                    # clear, then set it - two fire-and-forget frames
+                    cw = self._co_last_cw.get(node_id, 0x000F) | (1 << 5)
+                    _S_CW_POS.pack_into(msg.data, 0, cw & ~(1 << 4), int(value))
+                    self._bus.send(msg)
+                    _S_CW_POS.pack_into(msg.data, 0, cw | (1 << 4), int(value))
+                    self._bus.send(msg)
+                    self._co_last_cw[node_id] = cw & ~(1 << 4)
+                    return
                 except Exception:
-                    cw = 0x000F
+                    pass
+            try:
+                node = self._get_or_add_node(node_id)
+                # SDO fallback: each transaction is a request/response round
+                # trip, so keep it to three - the mode write above is sticky
+                # and the controlword is cached instead of re-uploaded.
+                node.sdo.download(0x607A, 0x00, _PACK_I32(int(value)))
+                cw = self._co_last_cw.get(node_id, 0x000F)
                 cw |= (1 << 4) | (1 << 5)
-                node.sdo.download(0x6040, 0x00, struct.pack('<H', cw))
+                node.sdo.download(0x6040, 0x00, _PACK_U16(cw))
                 cw &= ~(1 << 4)
-                node.sdo.download(0x6040, 0x00, struct.pack('<H', cw))
+                node.sdo.download(0x6040, 0x00, _PACK_U16(cw))
+                self._co_last_cw[node_id] = cw
                 return
             except Exception:
                 pass
+        self._send_position_raw(node_id, value)
 
+    def _send_position_raw(self, node_id: int, value: float) -> None:
         if self.simulate:
-            self._stub_last[node_id] = float(value)
+            self._stub_last[node_id & 0xFF] = float(value)
             return
         # Raw protocol fallback: ensure Position mode then write loc_ref (0x7016) as float32
-        if self.connected and self._bus is not None:
+        if self._bus is not None:
             try:
                 # Mirror move.py by ensuring the node is enabled and in position mode
                 if node_id not in self._enabled_nodes:
                     try:
                         self._rs_raw_write_param_u32(node_id, 0x7005, 1)
-                        try:
-                            time.sleep(0.02)
-                        except Exception:
-                            pass
                         self._rs_raw_send(0x03, int(node_id), bytes(8))
                         self._enabled_nodes.add(node_id)
+                        self._enable_ready_ns[int(node_id)] = _mono_ns() + 20_000_000
                     except Exception:
                         pass
                 if node_id not in self._pos_mode_nodes:
@@ -337,36 +747,13 @@ class RobStrideManager:
                 pass
 
     def read_position(self, node_id: int) -> float:
-        # Prefer RobStride client when connected: read mechanical position (radians)
-        if self.connected and robstride_lib is not None and self._rs_client is not None:
-            try:
-                angle = self._rs_client.read_param(node_id, 'mechpos')
-                return float(angle)
-            except Exception:
-                pass
-
-        if self.connected and self._co_net is not None and canopen is not None:
-            try:
-                node = self._get_or_add_node(node_id)
-                pos_bytes = node.sdo.upload(0x6064, 0x00)
-                return int.from_bytes(pos_bytes, 'little', signed=True)
-            except Exception:
-                pass
-
-        if self.simulate:
-            base = self._stub_last.get(node_id, 0.0)
-            self._stub_phase += 0.1
-            return base + 0.1 * math.sin(self._stub_phase)
-
-        # Raw protocol fallback: read mechpos (0x7019) as float32
-        if self.connected and self._bus is not None:
-            try:
-                val = self._rs_raw_read_param_f32(node_id, 0x7019)
-                if val is not None:
-                    return float(val)
-            except Exception:
-                pass
-        return 0.0
+        # Non-blocking: enqueue a refresh for the worker and return the last
+        # cached reading. The first call for a node yields 0.0 until a real
+        # value lands; callers that only want the cache without triggering a
+        # bus read use get_cached_position instead.
+        self.request_read(node_id)
+        val = self._last_read_pos.get(int(node_id))
+        return float(val) if val is not None else 0.0
 
     # Internal helpers
     def _open_bus(self) -> None:
@@ -382,14 +769,39 @@ class RobStrideManager:
                 self._co_net.connect(bustype=self.interface, channel=self.channel, bitrate=self.bitrate)
             except Exception:
                 self._co_net = None
+        self.canfd = False
         if can is not None:
-            try:
-                self._bus = can.Bus(interface=self.interface, channel=self.channel, bitrate=self.bitrate)
-            except Exception:
+            # Probe CAN-FD first; adapters and channels without FD raise and
+            # we fall back to classic frames. The raw protocol still uses
+            # 8-byte payloads either way, but FD capability is recorded so
+            # future bulk transfers can take advantage of it.
+            if self._channel_supports_fd():
                 try:
-                    self._bus = can.Bus(interface=self.interface, channel=self.channel)
+                    self._bus = can.Bus(interface=self.interface, channel=self.channel, bitrate=self.bitrate, fd=True)
+                    self.canfd = True
                 except Exception:
-                    self._bus = None
+                    pass
+            if self._bus is None:
+                try:
+                    self._bus = can.Bus(interface=self.interface, channel=self.channel, bitrate=self.bitrate)
+                except Exception:
+                    try:
+                        self._bus = can.Bus(interface=self.interface, channel=self.channel)
+                    except Exception:
+                        self._bus = None
+        self._tune_bus_socket()
+        if self._bus is not None:
+            try:
+                self._bus.set_filters(self._standing_filters())
+            except Exception:
+                pass
+            # Single background reader; every other path consumes frames
+            # from the dispatch cache instead of competing on recv()
+            try:
+                self._rx_notifier = can.Notifier(self._bus, [self._on_can_msg], timeout=0.1)
+            except Exception:
+                self._rx_notifier = None
+        self._open_raw_tx_socket()
         # Initialize RobStride client if a CAN bus is available
         if self._bus is not None and robstride_lib is not None and self._prefer_vendor:
             try:
@@ -398,6 +810,68 @@ class RobStrideManager:
             except Exception:
                 self._rs_client = None
 
+    def _channel_supports_fd(self) -> bool:
+        # On socketcan, fd=True only sets CAN_RAW_FD_FRAMES, which any
+        # modern kernel accepts regardless of the hardware - so the socket
+        # option is not a capability probe. The interface MTU is: 72
+        # (struct canfd_frame) on FD-capable channels, 16 on classic CAN.
+        if self.interface != 'socketcan':
+            # Other backends genuinely raise on fd=True when unsupported;
+            # let the Bus constructor attempt decide
+            return True
+        try:
+            import fcntl
+            import socket as _socket
+            SIOCGIFMTU = 0x8921
+            s = _socket.socket(_socket.AF_INET, _socket.SOCK_DGRAM)
+            try:
+                ifreq = struct.pack('16si12x', self.channel.encode()[:15], 0)
+                mtu = struct.unpack('16si12x', fcntl.ioctl(s.fileno(), SIOCGIFMTU, ifreq))[1]
+            finally:
+                s.close()
+            return mtu >= 72
+        except Exception:
+            return False
+
+    def _tune_bus_socket(self) -> None:
+        # Low-latency tuning for the socketcan backend: grow the socket
+        # buffers so bursty batches are not dropped, raise priority so TX
+        # frames jump the qdisc, and skip loopback of our own frames. Other
+        # backends (kvaser, sim) do not expose a raw socket; best-effort.
+        sock = getattr(self._bus, 'socket', None)
+        if sock is None:
+            sock = getattr(self._bus, '_socket', None)
+        if sock is None:
+            return
+        import socket as _socket
+        if self.interface in ('socketcand', 'socketcan_tcp'):
+            # TCP bridge: without NODELAY each send can sit behind Nagle for
+            # tens of ms, and QUICKACK (Linux) avoids delayed-ACK stalls
+            for opt in (
+                _socket.TCP_NODELAY,
+                getattr(_socket, 'TCP_QUICKACK', None),
+            ):
+                if opt is None:
+                    continue
+                try:
+                    sock.setsockopt(_socket.IPPROTO_TCP, opt, 1)
+                except Exception:
+                    pass
+        for level, opt, value in (
+            (_socket.SOL_SOCKET, _socket.SO_RCVBUF, 1 << 20),
+            (_socket.SOL_SOCKET, _socket.SO_SNDBUF, 1 << 20),
+            (_socket.SOL_SOCKET, getattr(_socket, 'SO_PRIORITY', 12), 6),
+            (getattr(_socket, 'SOL_CAN_RAW', 101), getattr(_socket, 'CAN_RAW_RECV_OWN_MSGS', 4), 0),
+            # Busy-poll the driver for up to 50 us inside blocking recv()
+            # before parking in epoll: trades a little CPU for us-level
+            # reply latency. Needs CAP_NET_ADMIN; silently skipped without.
+            (_socket.SOL_SOCKET, getattr(_socket, 'SO_BUSY_POLL', 46), 50),
+        ):
+            try:
+                sock.setsockopt(level, opt, value)
+            except Exception:
+                pass
+
     # --- Raw RobStride protocol (from candump) ---
     # Extended 29-bit ID layout appears as 4 bytes: [cmd, 0x00, dest, src]
     # Observed commands:
@@ -417,38 +891,234 @@ class RobStrideManager:
         # 'src' is the byte to place in the third position.
         s = self._host_addr if src is None else int(src) & 0xFF
         d = int(dest) & 0xFF
-        return ((int(cmd) & 0xFF) << 24) | (0x00 << 16) | (s << 8) | d
+        key = (int(cmd), s, d)
+        cid = self._id_cache.get(key)
+        if cid is None:
+            cid = ((key[0] & 0xFF) << 24) | (0x00 << 16) | (s << 8) | d
+            self._id_cache[key] = cid
+        return cid
+
+    def _open_raw_tx_socket(self) -> None:
+        # Direct AF_CAN TX socket for the hottest send path: one struct.pack
+        # and one send() syscall per frame, skipping python-can's per-Message
+        # object churn. RX stays on the python-can bus and its notifier
+        # (kernel loopback still delivers replies there).
+        self._raw_sock = None
+        if self.interface != 'socketcan':
+            return
+        try:
+            import socket as _socket
+            s = _socket.socket(_socket.AF_CAN, _socket.SOCK_RAW, _socket.CAN_RAW)
+            # TX-only: a zero-length filter list stops the kernel queuing
+            # every bus frame into a receive buffer nobody drains
+            try:
+                s.setsockopt(getattr(_socket, 'SOL_CAN_RAW', 101),
+                             getattr(_socket, 'CAN_RAW_FILTER', 1), b'')
+            except Exception:
+                pass
+            s.bind((self.channel,))
+            self._raw_sock = s
+        except Exception:
+            self._raw_sock = None
 
     def _rs_raw_send(self, cmd: int, dest: int, data: bytes) -> None:
+        arb_id = self._rs_make_id(cmd, dest)
+        if self._raw_sock is not None:
+            try:
+                self._raw_sock.send(
+                    _PACK_FRAME(arb_id | _CAN_EFF_FLAG, len(data), bytes(data))
+                )
+                return
+            except (BlockingIOError, InterruptedError):
+                # TX queue full or interrupted: drop this frame - coalescing
+                # re-posts the newest value on the next tick
+                return
+            except OSError:
+                # Socket went away; fall through to the python-can path
+                pass
         if self._bus is None or can is None:
             return
-        msg = can.Message(arbitration_id=self._rs_make_id(cmd, dest), data=data, is_extended_id=True)
+        msg = can.Message(arbitration_id=arb_id, data=data, is_extended_id=True)
         self._bus.send(msg)
 
+    def _rs_raw_send_burst(self, dests, cmd: int, data: bytes) -> bool:
+        # Homogeneous burst (same cmd and payload to many nodes) in one
+        # sendmmsg syscall on the raw TX socket. Returns False when the
+        # caller should fall back to per-frame sends.
+        if self._raw_sock is None or len(dests) < 2:
+            return False
+        send_many = _resolve_sendmmsg()
+        if not send_many:
+            return False
+        payload = bytes(data)
+        size = len(payload)
+        frames = [
+            _PACK_FRAME(self._rs_make_id(cmd, d) | _CAN_EFF_FLAG, size, payload)
+            for d in dests
+        ]
+        try:
+            sent = send_many(self._raw_sock.fileno(), frames)
+        except Exception:
+            return False
+        if sent < 0:
+            return False
+        # Partial transmit (TX queue pressure): finish the tail per-frame
+        for d in dests[sent:]:
+            try:
+                self._rs_raw_send(cmd, d, payload)
+            except Exception:
+                pass
+        return True
+
+    def _raw_write_template(self, node_id: int, index: int):
+        # Host is part of the key so a host_addr change naturally misses.
+        # The cached can.Message is mutated in place before each send:
+        # Message.__init__ copies its data into an owned bytearray, so the
+        # value bytes are packed straight into msg.data.
+        key = (self._host_addr, int(node_id), int(index))
+        msg = self._raw_tx_templates.get(key)
+        if msg is None:
+            buf = bytearray(8)
+            buf[:2] = _PACK_U16(key[2] & 0xFFFF)
+            msg = can.Message(
+                arbitration_id=self._rs_make_id(0x12, key[1]),
+                data=buf,
+                is_extended_id=True,
+            )
+            self._raw_tx_templates[key] = msg
+        return msg
+
     def _rs_raw_write_param_u32(self, node_id: int, index: int, value: int) -> None:
-        import struct
-        idx_le = struct.pack('<H', int(index) & 0xFFFF) + b"\x00\x00"
-        val = struct.pack('<I', int(value) & 0xFFFFFFFF)
-        self._rs_raw_send(0x12, int(node_id), idx_le + val)
+        if self._raw_sock is not None:
+            self._rs_raw_send(
+                0x12, int(node_id),
+                _PACK_WRITE_U32(int(index) & 0xFFFF, int(value) & 0xFFFFFFFF))
+            return
+        if self._bus is None or can is None:
+            return
+        msg = self._raw_write_template(node_id, index)
+        _S_U32.pack_into(msg.data, 4, int(value) & 0xFFFFFFFF)
+        self._bus.send(msg)
 
     def _rs_raw_write_param_f32(self, node_id: int, index: int, value: float) -> None:
-        import struct
-        idx_le = struct.pack('<H', int(index) & 0xFFFF) + b"\x00\x00"
-        val = struct.pack('<f', float(value))
-        self._rs_raw_send(0x12, int(node_id), idx_le + val)
+        if index == 0x7016:
+            # Once a kernel cyclic task owns this node's loc_ref stream, a
+            # direct send would be overridden by its next retransmission of
+            # the old target; update the task instead. The BCM API takes a
+            # can.Message, so task updates stay on the template path.
+            task = self._periodic_tasks.get(int(node_id))
+            if task is not None and can is not None:
+                msg = self._raw_write_template(node_id, index)
+                _S_F32.pack_into(msg.data, 4, float(value))
+                try:
+                    task.modify_data(msg)
+                    return
+                except Exception:
+                    self._stop_periodic(int(node_id))
+        if self._raw_sock is not None:
+            self._rs_raw_send(
+                0x12, int(node_id),
+                _PACK_WRITE_F32(int(index) & 0xFFFF, float(value)))
+            return
+        if self._bus is None or can is None:
+            return
+        msg = self._raw_write_template(node_id, index)
+        _S_F32.pack_into(msg.data, 4, float(value))
+        self._bus.send(msg)
+
+    def _stop_periodic(self, node_id: int | None = None) -> None:
+        # Stop one node's kernel cyclic task (on disable) or all of them
+        # (on disconnect) so the controller does not keep streaming frames
+        if node_id is None:
+            tasks, self._periodic_tasks = self._periodic_tasks, {}
+            items = list(tasks.values())
+        else:
+            task = self._periodic_tasks.pop(node_id, None)
+            items = [task] if task is not None else []
+        for task in items:
+            try:
+                task.stop()
+            except Exception:
+                pass
+
+    def _write_params_batch(self, writes: List[Tuple[int, int, float]]) -> set | None:
+        """Send float32 param writes for many nodes back-to-back on the raw bus.
+
+        Write frames carry no mandatory reply, so the whole burst goes out
+        without waiting between frames; any status frames the motors push in
+        response are drained afterwards with non-blocking recv calls. Returns
+        the set of node ids actually written, or None when the raw path does
+        not apply (no bus, or a vendor/canopen backend is in charge) so the
+        caller falls back to the per-node loop.
+        """
+        if self._bus is None or can is None:
+            return None
+        if self._prefer_vendor and self._rs_client is not None:
+            return None
+        if self._co_net is not None and not self._prefer_vendor:
+            return None
+        send = self._bus.send
+        written: set = set()
+        for node_id, index, value in writes:
+            try:
+                msg = self._raw_write_template(node_id, index)
+                _S_F32.pack_into(msg.data, 4, float(value))
+                # Hand the loc_ref stream to the kernel's cyclic sender when
+                # the backend offers one (SocketCAN BCM): the controller
+                # retransmits on its own and Python only pays for changes.
+                # Only loc_ref writes may touch the task; any other index
+                # would silently retask the cyclic stream.
+                task = self._periodic_tasks.get(node_id) if index == 0x7016 else None
+                if task is not None:
+                    try:
+                        task.modify_data(msg)
+                    except Exception:
+                        self._stop_periodic(node_id)
+                        send(msg)
+                elif self._periodic_ok and index == 0x7016:
+                    try:
+                        self._periodic_tasks[node_id] = self._bus.send_periodic(msg, 0.01)
+                    except Exception:
+                        self._periodic_ok = False
+                        send(msg)
+                elif self._raw_sock is not None:
+                    # No cyclic task in play: packed can_frame bytes on the
+                    # raw socket, same as the other hot sends
+                    self._rs_raw_send(0x12, node_id, bytes(msg.data))
+                else:
+                    send(msg)
+                written.add(node_id)
+            except (can.CanError, OSError, ValueError):
+                # A full TX queue just drops this frame; the caller defers
+                # the node's newest value to the next flush
+                pass
+            if self._batch_pace_s > 0.0:
+                time.sleep(self._batch_pace_s)
+        # Reap whatever came back so unsolicited replies never pile up in
+        # the socket buffer ahead of the next read transaction (the
+        # notifier already does this when it is running).
+        if written and self._rx_notifier is None:
+            try:
+                while self._bus.recv(timeout=0) is not None:
+                    pass
+            except Exception:
+                pass
+        return written
 
     def _rs_raw_read_param_f32(self, node_id: int, index: int, timeout_s: float = 0.02) -> float | None:
         if self._bus is None or can is None:
             return None
-        import struct, time as _time
+        if self._rx_notifier is not None:
+            raw = self._raw_read_wait(node_id, index, timeout_s)
+            return _S_F32.unpack(raw)[0] if raw is not None else None
         # Send read request
-        payload = struct.pack('<H', int(index) & 0xFFFF) + b"\x00\x00" + b"\x00\x00\x00\x00"
+        payload = _PACK_READ_REQ(int(index) & 0xFFFF)
         self._rs_raw_send(0x11, int(node_id), payload)
         # Expected response ID swaps dest/src
         expect_id = self._rs_make_id(0x11, self._host_addr, src=int(node_id))
         idx_bytes = payload[:4]
-        end_time = _time.time() + max(0.0, float(timeout_s))
-        while _time.time() < end_time:
+        deadline = _mono_ns() + int(max(0.0, float(timeout_s)) * 1e9)
+        while _mono_ns() < deadline:
             msg = self._bus.recv(timeout=0.005)
             if msg is None:
                 continue
@@ -461,19 +1131,21 @@ class RobStrideManager:
                 continue
             if data[:4] != idx_bytes:
                 continue
-            return struct.unpack('<f', data[4:8])[0]
+            return _S_F32.unpack_from(data, 4)[0]
         return None
 
     def _rs_raw_read_param_u32(self, node_id: int, index: int, timeout_s: float = 0.02) -> int | None:
         if self._bus is None or can is None:
             return None
-        import struct, time as _time
-        payload = struct.pack('<H', int(index) & 0xFFFF) + b"\x00\x00" + b"\x00\x00\x00\x00"
+        if self._rx_notifier is not None:
+            raw = self._raw_read_wait(node_id, index, timeout_s)
+            return int(_S_U32.unpack(raw)[0]) if raw is not None else None
+        payload = _PACK_READ_REQ(int(index) & 0xFFFF)
         self._rs_raw_send(0x11, int(node_id), payload)
         expect_id = self._rs_make_id(0x11, self._host_addr, src=int(node_id))
         idx_bytes = payload[:4]
-        end_time = _time.time() + max(0.0, float(timeout_s))
-        while _time.time() < end_time:
+        deadline = _mono_ns() + int(max(0.0, float(timeout_s)) * 1e9)
+        while _mono_ns() < deadline:
             msg = self._bus.recv(timeout=0.005)
             if msg is None:
                 continue
@@ -486,9 +1158,65 @@ class RobStrideManager:
                 continue
             if data[:4] != idx_bytes:
                 continue
-            return int(struct.unpack('<I', data[4:8])[0])
+            return int(_S_U32.unpack_from(data, 4)[0])
         return None
 
+    def _rs_raw_read_many(self, node_ids, index: int = 0x7019, timeout_s: float = 0.05) -> Dict[int, float]:
+        """Burst read requests for many nodes and reap replies in one window.
+
+        Sequential reads pay their timeout per node; here all 0x11 requests
+        go out first and one drain collects the float32 replies, so N reads
+        cost transmit time plus a single window.
+        """
+        out: Dict[int, float] = {}
+        if self._bus is None or can is None or not node_ids:
+            return out
+        idx = int(index) & 0xFFFF
+        payload = _PACK_READ_REQ(idx)
+        deadline = _mono_ns() + int(max(0.0, float(timeout_s)) * 1e9)
+        if self._rx_notifier is not None:
+            pending = {int(n) for n in node_ids}
+            for n in pending:
+                self._rx_param.pop((n, idx), None)
+            if not self._rs_raw_send_burst(list(pending), 0x11, payload):
+                for n in pending:
+                    try:
+                        self._rs_raw_send(0x11, n, payload)
+                    except Exception:
+                        pass
+            while pending and _mono_ns() < deadline:
+                self._rx_event.wait(0.005)
+                self._rx_event.clear()
+                for n in list(pending):
+                    raw = self._rx_param.get((n, idx))
+                    if raw is None:
+                        continue
+                    pending.discard(n)
+                    try:
+                        out[n] = float(_S_F32.unpack(raw)[0])
+                    except Exception:
+                        pass
+        else:
+            expected = {
+                self._rs_make_id(0x11, self._host_addr, src=int(n)): int(n)
+                for n in node_ids
+            }
+            if not self._rs_raw_send_burst(list(expected.values()), 0x11, payload):
+                for n in expected.values():
+                    try:
+                        self._rs_raw_send(0x11, n, payload)
+                    except Exception:
+                        pass
+            for arb_id, data in self._drain_matching(expected, deadline):
+                n = expected.pop(arb_id)
+                if len(data) != 8 or data[:2] != payload[:2]:
+                    continue
+                try:
+                    out[n] = float(_S_F32.unpack_from(data, 4)[0])
+                except Exception:
+                    pass
+        return out
+
     def _get_or_add_node(self, node_id: int):
         if self._co_net is None or canopen is None:
             raise RuntimeError("CANopen not initialized")
@@ -506,17 +1234,32 @@ class RobStrideManager:
     # Connection management
     def connect(self) -> bool:
         # Always attempt to open the real bus regardless of simulation flag
+        _load_backends()
         try:
             self._open_bus()
             self.connected = (self._co_net is not None) or (self._bus is not None)
         except Exception:
             self.connected = False
+        self._select_send_path()
         if self.connected:
             self._start_worker()
         return self.connected
 
     def disconnect(self) -> None:
         self.connected = False
+        try:
+            if self._rx_notifier is not None:
+                self._rx_notifier.stop()
+        except Exception:
+            pass
+        self._rx_notifier = None
+        self._rx_param.clear()
+        if self._raw_sock is not None:
+            try:
+                self._raw_sock.close()
+            except Exception:
+                pass
+            self._raw_sock = None
         try:
             if self._co_net is not None:
                 self._co_net.disconnect()
@@ -528,6 +1271,17 @@ class RobStrideManager:
         self._rs_client = None
         self._enabled_nodes.clear()
         self._pos_mode_nodes.clear()
+        self._co_pp_nodes.clear()
+        self._co_last_cw.clear()
+        self._rpdo_frames.clear()
+        self._rpdo_failed.clear()
+        self._stop_periodic()
+        self._periodic_ok = True
+        self._last_sent_pos.clear()
+        self._last_send_ts.clear()
+        self._enable_ready_ns.clear()
+        self._read_req_ns.clear()
+        self._send_position_impl = self._send_position_stub
         self._stop_worker()
 
     def is_connected(self) -> bool:
@@ -543,6 +1297,19 @@ class RobStrideManager:
             except Exception:
                 pass
 
+    def prepare_nodes_batch(self, node_ids) -> None:
+        # No bus I/O happens here (RemoteNode construction is local), so the
+        # batch form just checks the simulate/canopen guards once for all ids.
+        if self.simulate:
+            return
+        if self._co_net is None or canopen is None:
+            return
+        for node_id in node_ids:
+            try:
+                self._get_or_add_node(node_id)
+            except Exception:
+                pass
+
     def node_status(self, node_id: int) -> bool:
         # With RobStride, assume online when connected (no heartbeat implemented here)
         if self.connected:
@@ -553,29 +1320,111 @@ class RobStrideManager:
 
     # --- Async API for Blender handler ---
     def post_position(self, node_id: int, value: float) -> None:
+        # Lock-free: dict item writes are atomic under the GIL and the
+        # queue put is a single C call
+        if self.simulate and not self.connected:
+            self._stub_last[node_id & 0xFF] = float(value)
+            return
+        self._pending_pos_q.put_nowait((int(node_id), float(value)))
+        self._work_event.set()
+
+    def post_positions_batch(self, pairs) -> None:
+        # Batched variant of post_position so the frame handler enqueues N
+        # targets in a single Python call.
+        if self.simulate and not self.connected:
+            for node_id, value in pairs:
+                self._stub_last[int(node_id) & 0xFF] = float(value)
+            return
+        put = self._pending_pos_q.put_nowait
+        for node_id, value in pairs:
+            put((int(node_id), float(value)))
+        self._work_event.set()
+
+    def post_pid(self, node_id: int, kp: float, ki: float, kd: float) -> None:
+        # Non-blocking PID update; the worker performs the SDO/param writes.
         if self.simulate and not self.connected:
-            with self._lock:
-                self._stub_last[node_id] = float(value)
             return
         with self._lock:
-            self._pending_pos[node_id] = float(value)
+            self._pending_pid[int(node_id)] = (float(kp), float(ki), float(kd))
+        self._work_event.set()
 
-    def request_read(self, node_id: int) -> None:
+    def post_enable(self, node_id: int, enable: bool) -> None:
+        # Non-blocking enable/disable; the worker issues the actual CAN frames
+        # so mode transitions never stall the frame handler. Consecutive
+        # toggles for the same node coalesce to the newest state.
         if self.simulate and not self.connected:
-            # synthesize position
-            with self._lock:
-                base = self._stub_last.get(node_id, 0.0)
-                self._stub_phase += 0.1
-                self._last_read_pos[node_id] = base + 0.1 * math.sin(self._stub_phase)
             return
         with self._lock:
-            self._pending_reads.add(int(node_id))
+            self._pending_enable[int(node_id)] = bool(enable)
+        self._work_event.set()
+
+    def request_read(self, node_id: int, bypass_cache: bool = False) -> None:
+        if self.simulate and not self.connected:
+            # synthesize position
+            base = self._stub_last[node_id & 0xFF]
+            self._stub_idx = (self._stub_idx + 4) & 0xFF
+            self._last_read_pos[node_id] = base + 0.1 * _SIN_TAB[self._stub_idx]
+            return
+        nid = int(node_id)
+        now = _mono_ns()
+        if not bypass_cache and now - self._read_req_ns.get(nid, 0) < self._read_ttl_ns:
+            return
+        self._read_req_ns[nid] = now
+        self._pending_reads_q.put_nowait(nid)
+        self._work_event.set()
+
+    def request_reads_batch(self, node_ids) -> None:
+        # Batched variant of request_read; mirrors post_positions_batch.
+        if self.simulate and not self.connected:
+            for node_id in node_ids:
+                base = self._stub_last[int(node_id) & 0xFF]
+                self._stub_idx = (self._stub_idx + 4) & 0xFF
+                self._last_read_pos[int(node_id)] = base + 0.1 * _SIN_TAB[self._stub_idx]
+            return
+        put = self._pending_reads_q.put_nowait
+        now = _mono_ns()
+        req_ns = self._read_req_ns
+        queued = False
+        for node_id in node_ids:
+            nid = int(node_id)
+            if now - req_ns.get(nid, 0) < self._read_ttl_ns:
+                continue
+            req_ns[nid] = now
+            put(nid)
+            queued = True
+        if queued:
+            self._work_event.set()
 
     def get_cached_position(self, node_id: int) -> float | None:
-        with self._lock:
-            return self._last_read_pos.get(int(node_id))
+        return self._last_read_pos.get(int(node_id))
 
     # --- Worker management ---
+    def set_realtime(self, enabled: bool, cpu: int | None = None, prio: int = 80) -> None:
+        # Takes effect when the worker thread (re)starts
+        self._prefer_rt = bool(enabled)
+        self._rt_cpu = cpu
+        self._rt_prio = int(prio)
+
+    def _enter_realtime(self) -> None:
+        # Called from inside the worker thread. Every step is best-effort:
+        # without CAP_SYS_NICE the scheduler calls fail and the worker simply
+        # keeps running at normal priority.
+        try:
+            if self._rt_cpu is not None:
+                os.sched_setaffinity(0, {int(self._rt_cpu)})
+        except Exception:
+            pass
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self._rt_prio))
+        except Exception:
+            pass
+        try:
+            import ctypes
+            MCL_CURRENT, MCL_FUTURE = 1, 2
+            ctypes.CDLL("libc.so.6", use_errno=True).mlockall(MCL_CURRENT | MCL_FUTURE)
+        except Exception:
+            pass
+
     def _start_worker(self) -> None:
         if self._worker_thread and self._worker_thread.is_alive():
             return
@@ -585,6 +1434,7 @@ class RobStrideManager:
 
     def _stop_worker(self) -> None:
         self._stop_event.set()
+        self._work_event.set()
         t = self._worker_thread
         if t and t.is_alive():
             try:
@@ -593,18 +1443,157 @@ class RobStrideManager:
                 pass
         self._worker_thread = None
 
+    def _note_worker_error(self) -> None:
+        # Rate-limited so a persistently failing node cannot flood the
+        # console at tick rate, while still leaving a trace to act on
+        now = _mono_ns()
+        if now - self._last_err_ns >= 1_000_000_000:
+            self._last_err_ns = now
+            import traceback
+            traceback.print_exc()
+
     def _worker_loop(self) -> None:
         # Process pending position updates and read requests with minimal blocking
+        if self._prefer_rt:
+            self._enter_realtime()
+        # Opt-in profiling for laggy-playback reports: run Blender with
+        # ROBSTRIDE_PROFILE=1 and read the dump with pstats after disconnect
+        profiler = None
+        if os.getenv('ROBSTRIDE_PROFILE'):
+            try:
+                import cProfile
+                profiler = cProfile.Profile()
+                profiler.enable()
+            except Exception:
+                profiler = None
+        # Scratch containers live for the thread's lifetime and are cleared
+        # per iteration, so an idle tick allocates nothing. Held-back
+        # setpoints wait in deferred_pos rather than re-entering the queue:
+        # a re-queued old value could land behind a newer post from the same
+        # iteration and win the last-in coalesce.
+        latest_pos: Dict[int, float] = {}
+        deferred_pos: Dict[int, float] = {}
+        read_set: set = set()
+        wait_s = 0.05
         while not self._stop_event.is_set():
-            # Snapshot pending work
+            # Block until a producer posts work (or a timeout tick for the
+            # periodic fallbacks); clear before snapshotting so anything
+            # enqueued after this point re-arms the event
+            self._work_event.wait(timeout=wait_s)
+            self._work_event.clear()
+            wait_s = 0.05
+            # Snapshot pending work. Positions/reads drain lock-free from
+            # their queues, coalescing to the newest value per node.
             with self._lock:
-                pos_items = list(self._pending_pos.items())
-                self._pending_pos.clear()
-                read_ids = list(self._pending_reads)
-                self._pending_reads.clear()
+                pid_items = list(self._pending_pid.items()) if self._pending_pid else ()
+                self._pending_pid.clear()
+                enable_items = list(self._pending_enable.items()) if self._pending_enable else ()
+                self._pending_enable.clear()
+            latest_pos.clear()
+            # Deferred values go in first so anything posted since then
+            # overwrites them; the queue drain below keeps last-in wins
+            if deferred_pos:
+                latest_pos.update(deferred_pos)
+                deferred_pos.clear()
+            try:
+                while True:
+                    node_id, value = self._pending_pos_q.get_nowait()
+                    latest_pos[node_id] = value
+            except queue.Empty:
+                pass
+            pos_items = list(latest_pos.items()) if latest_pos else []
+            read_set.clear()
+            try:
+                while True:
+                    read_set.add(self._pending_reads_q.get_nowait())
+            except queue.Empty:
+                pass
+            read_ids = list(read_set) if read_set else ()
 
-            # Send positions
+            # Push PID updates first so new gains apply to this batch
+            for node_id, gains in pid_items:
+                try:
+                    self.set_pid(node_id, *gains)
+                except Exception:
+                    pass
+
+            # Apply enable/disable transitions before any position writes
+            for node_id, enable in enable_items:
+                try:
+                    self.enable_node(node_id, enable)
+                except Exception:
+                    pass
+
+            # Only the latest value per node is pending (post_position
+            # overwrites), and values that match the last transmission are
+            # dropped here so an unchanged pose costs zero bus traffic
+            last_sent = self._last_sent_pos
+            if pos_items:
+                pos_items = [
+                    (n, v) for n, v in pos_items
+                    if abs(v - last_sent.get(n, float('inf'))) > _RESEND_EPS
+                ]
+            # Token-bucket per node: targets arriving faster than the
+            # per-node floor are deferred (re-enqueued, newest wins) so a
+            # runaway producer cannot overrun the bus or the adapter
+            if pos_items:
+                now = time.monotonic()
+                send_ts = self._last_send_ts
+                ready = []
+                now_ns = _mono_ns()
+                for n, v in pos_items:
+                    hold_ns = self._enable_ready_ns.get(n, 0) - now_ns
+                    if hold_ns > 0:
+                        # Recently enabled: give the motor its settle window
+                        # while the worker keeps serving other nodes
+                        deferred_pos[n] = v
+                        wait_s = min(wait_s, hold_ns * 1e-9)
+                        continue
+                    elapsed = now - send_ts.get(n, 0.0)
+                    min_interval = self._min_send_interval_s
+                    if elapsed < min_interval:
+                        deferred_pos[n] = v
+                        # Shorten only the next wait (rather than setting the
+                        # wake event, which would spin until the floor passes)
+                        wait_s = min(wait_s, min_interval - elapsed)
+                    else:
+                        send_ts[n] = now
+                        ready.append((n, v))
+                pos_items = ready
+            sent_items = pos_items
+
+            # Send positions. When every node is already brought up (enabled
+            # and in Position mode), the raw path can burst all loc_ref
+            # frames in one pass instead of paying the per-node chain; nodes
+            # still needing enable/run_mode stay on the slow path below.
+            if pos_items and self.connected and all(
+                n in self._enabled_nodes and n in self._pos_mode_nodes
+                for n, _v in pos_items
+            ):
+                written = self._write_params_batch(
+                    [(n, 0x7016, v) for n, v in pos_items]
+                )
+                if written is not None:
+                    # The raw batch path was in charge: replaying the whole
+                    # batch through the per-node loop would duplicate the
+                    # frames that did go out, so only TX-dropped values are
+                    # deferred to the next tick
+                    if len(written) != len(pos_items):
+                        sent_items = [(n, v) for n, v in pos_items if n in written]
+                        for n, v in pos_items:
+                            if n not in written:
+                                deferred_pos[n] = v
+                        wait_s = min(wait_s, self._min_send_interval_s)
+                    pos_items = []
             for node_id, value in pos_items:
+                # Offline simulate first: a plain array store that cannot
+                # raise, so it skips the guard the hardware paths need
+                if not (self.connected and (
+                        self._rs_client is not None
+                        or self._co_net is not None
+                        or self._bus is not None)):
+                    self._stub_last[node_id & 0xFF] = float(value)
+                    continue
                 try:
                     # Ensure enabled and in Position mode
                     if self.connected and self._prefer_vendor and self._rs_client is not None and robstride_lib is not None:
@@ -627,9 +1616,10 @@ class RobStrideManager:
                     elif self.connected and self._co_net is not None and canopen is not None and not self._prefer_vendor:
                         try:
                             node = self._get_or_add_node(node_id)
-                            import struct
-                            node.sdo.download(0x6060, 0x00, struct.pack('<b', 1))
-                            node.sdo.download(0x607A, 0x00, struct.pack('<i', int(value)))
+                            if node_id not in self._co_pp_nodes:
+                                node.sdo.download(0x6060, 0x00, _MODE_PP)
+                                self._co_pp_nodes.add(node_id)
+                            node.sdo.download(0x607A, 0x00, _PACK_I32(int(value)))
                         except Exception:
                             pass
                     elif self.connected and self._bus is not None:
@@ -640,6 +1630,7 @@ class RobStrideManager:
                                     self._rs_raw_write_param_u32(node_id, 0x7005, 1)
                                     self._rs_raw_send(0x03, int(node_id), bytes(8))
                                     self._enabled_nodes.add(node_id)
+                                    self._enable_ready_ns[int(node_id)] = _mono_ns() + 20_000_000
                                 except Exception:
                                     pass
                             if node_id not in self._pos_mode_nodes:
@@ -648,51 +1639,67 @@ class RobStrideManager:
                             self._rs_raw_write_param_f32(node_id, 0x7016, float(value))
                         except Exception:
                             pass
-                    else:
-                        # Offline simulate
-                        with self._lock:
-                            self._stub_last[node_id] = float(value)
                 except Exception:
-                    # Never crash the worker
-                    pass
+                    # Never crash the worker; surface at most one failure
+                    # per second instead of hiding them entirely
+                    self._note_worker_error()
+                if self._batch_pace_s > 0.0:
+                    time.sleep(self._batch_pace_s)
+            if sent_items:
+                last_sent.update(sent_items)
 
-            # Perform reads
+            # Perform reads; the raw path pipelines them into one burst
+            if (read_ids and self.connected and self._bus is not None
+                    and not (self._prefer_vendor and self._rs_client is not None
+                             and robstride_lib is not None)
+                    and not (self._co_net is not None and canopen is not None
+                             and not self._prefer_vendor)):
+                for n, v in self._rs_raw_read_many(read_ids).items():
+                    self._last_read_pos[n] = v
+                read_ids = ()
             for node_id in read_ids:
+                if not (self.connected and (
+                        self._rs_client is not None
+                        or self._co_net is not None
+                        or self._bus is not None)):
+                    # Synthesized position: array loads and one store, no
+                    # exception guard required
+                    base = self._stub_last[node_id & 0xFF]
+                    self._stub_idx = (self._stub_idx + 4) & 0xFF
+                    self._last_read_pos[node_id] = base + 0.1 * _SIN_TAB[self._stub_idx]
+                    continue
                 try:
                     if self.connected and self._prefer_vendor and self._rs_client is not None and robstride_lib is not None:
                         try:
                             angle = self._rs_client.read_param(node_id, 'mechpos')
-                            with self._lock:
-                                self._last_read_pos[node_id] = float(angle)
+                            self._last_read_pos[node_id] = float(angle)
                         except Exception:
                             pass
                     elif self.connected and self._co_net is not None and canopen is not None and not self._prefer_vendor:
                         try:
                             node = self._get_or_add_node(node_id)
                             pos_bytes = node.sdo.upload(0x6064, 0x00)
-                            val = int.from_bytes(pos_bytes, 'little', signed=True)
-                            with self._lock:
-                                self._last_read_pos[node_id] = float(val)
+                            val = _S_I32.unpack_from(pos_bytes)[0]
+                            self._last_read_pos[node_id] = float(val)
                         except Exception:
                             pass
                     elif self.connected and self._bus is not None:
                         try:
                             val = self._rs_raw_read_param_f32(node_id, 0x7019)
                             if val is not None:
-                                with self._lock:
-                                    self._last_read_pos[node_id] = float(val)
+                                self._last_read_pos[node_id] = float(val)
                         except Exception:
                             pass
-                    else:
-                        with self._lock:
-                            base = self._stub_last.get(node_id, 0.0)
-                            self._stub_phase += 0.1
-                            self._last_read_pos[node_id] = base + 0.1 * math.sin(self._stub_phase)
                 except Exception:
-                    pass
+                    self._note_worker_error()
 
-            # Small sleep to yield CPU; adjust for throughput
-            time.sleep(0.002)
+        if profiler is not None:
+            try:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(
+                    os.getenv('TMPDIR', '/tmp'), 'robstride_worker.prof'))
+            except Exception:
+                pass
 
 
 # Singleton instance used by the add-on
@@ -2,45 +2,89 @@
 # scan_nodes.py — probe RobStride node IDs by requesting mechpos
 # Usage: sudo ./scan_nodes.py [iface] [first_id] [last_id]
 # Defaults: iface=can0, first_id=0, last_id=127
+#
+# Also importable: scan() runs the probe over an existing bus (or opens
+# one itself), so callers can reuse a live socket instead of paying a
+# second bus bring-up.
 
 import sys, time
+from typing import List, Optional
 import can
 
-iface    = sys.argv[1] if len(sys.argv) > 1 else "can0"
-first_id = int(sys.argv[2]) if len(sys.argv) > 2 else 0
-last_id  = int(sys.argv[3]) if len(sys.argv) > 3 else 127
-
 REQ_BASE = 0x11000000
-def req_id(n):  return REQ_BASE | (0xAA << 8) | (n & 0xFF)        # 0x1100AA<ID>
-def resp_id(n): return REQ_BASE | ((n & 0xFF) << 8) | 0xAA        # 0x1100<ID>AA
-
-payload = bytes([0x19, 0x70, 0x00, 0x00, 0, 0, 0, 0])  # read mechpos
-
-found = []
-
-with can.Bus(interface='socketcan', channel=iface) as bus:
-    # drain any stale frames
-    t_end = time.time() + 0.2
-    while time.time() < t_end:
-        msg = bus.recv(timeout=0.01)
-        if not msg: break
-
-    for nid in range(first_id, last_id + 1):
-        rid = resp_id(nid)
-        # Send the request
-        bus.send(can.Message(arbitration_id=req_id(nid),
-                             data=payload,
-                             is_extended_id=True))
-        # Wait briefly for the reply from this node
-        t0 = time.time()
-        ok = False
-        while time.time() - t0 < 0.03:  # 30 ms per ID (tune as needed)
+# All 256 request/response IDs computed once; the scan loop then only
+# indexes a tuple instead of redoing the shifts per candidate.
+REQ_IDS  = tuple(REQ_BASE | (0xAA << 8) | n for n in range(256))  # 0x1100AA<ID>
+RESP_IDS = tuple(REQ_BASE | (n << 8) | 0xAA for n in range(256))  # 0x1100<ID>AA
+
+PAYLOAD = bytes([0x19, 0x70, 0x00, 0x00, 0, 0, 0, 0])  # read mechpos
+
+
+def scan(iface: str = "can0", first_id: int = 0, last_id: int = 127,
+         listen_s: float = 0.5, bus: Optional["can.BusABC"] = None) -> List[int]:
+    """Probe node IDs in [first_id, last_id] and return the sorted hits.
+
+    Pass an already-open bus to skip the open/close; filters are
+    modified on it either way.
+    """
+    own_bus = bus is None
+    if own_bus:
+        bus = can.Bus(interface='socketcan', channel=iface)
+    found: List[int] = []
+    try:
+        # Kernel-side filter: only mechpos replies addressed to host 0xAA
+        # (0x1100<ID>AA) reach userspace, so other bus traffic never costs
+        # a recv() syscall during the listen window.
+        bus.set_filters([{"can_id": REQ_BASE | 0xAA,
+                          "can_mask": 0x1FFF00FF,
+                          "extended": True}])
+
+        # drain any stale frames: non-blocking recv empties the kernel
+        # queue in O(backlog) and returns immediately on a quiet bus
+        while bus.recv(timeout=0) is not None:
+            pass
+
+        # Phase 1: blast all requests back-to-back; replies are classified
+        # later by arbitration ID, so there is no per-ID reply wait.
+        expected = {RESP_IDS[nid]: nid for nid in range(first_id, last_id + 1)}
+        messages = [can.Message(arbitration_id=REQ_IDS[nid],
+                                data=PAYLOAD,
+                                is_extended_id=True)
+                    for nid in range(first_id, last_id + 1)]
+        for nid, msg in enumerate(messages, start=first_id):
+            try:
+                bus.send(msg)
+            except can.CanError:
+                # TX FIFO full: give the driver a slot and retry once
+                time.sleep(0.002)
+                try:
+                    bus.send(msg)
+                except can.CanError:
+                    pass
+            if nid % 16 == 15:
+                time.sleep(0.0002)  # brief pacing so slow adapters keep up
+
+        # Phase 2: one global listen window instead of 30 ms per ID.
+        # Integer monotonic deadline: no float math per iteration and
+        # immune to wall-clock jumps mid-scan.
+        deadline_ns = time.monotonic_ns() + int(listen_s * 1e9)
+        while expected and time.monotonic_ns() < deadline_ns:
             msg = bus.recv(timeout=0.01)
-            if msg and msg.arbitration_id == rid and len(msg.data) == 8:
+            if not msg or len(msg.data) != 8:
+                continue
+            nid = expected.pop(msg.arbitration_id, None)
+            if nid is not None:
                 found.append(nid)
-                ok = True
-                break
-        # small gap to avoid flooding
-        time.sleep(0.002)
+    finally:
+        if own_bus:
+            bus.shutdown()
+
+    found.sort()
+    return found
+
 
-print("Found node IDs:", found)
+if __name__ == "__main__":
+    iface    = sys.argv[1] if len(sys.argv) > 1 else "can0"
+    first_id = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    last_id  = int(sys.argv[3]) if len(sys.argv) > 3 else 127
+    print("Found node IDs:", scan(iface, first_id, last_id))